@@ -80,6 +80,18 @@ def bench_resolve_literal():
     return resolve_type(Literal["a", "b", "c"])
 
 
+@benchmark("Arg construction (help only)", iterations=10000)
+def bench_arg_help_only():
+    """Benchmark constructing an Arg with only help text."""
+    return Arg(help="Number of greetings")
+
+
+@benchmark("Arg construction (flags)", iterations=10000)
+def bench_arg_with_flags():
+    """Benchmark constructing an Arg with short and long flags."""
+    return Arg("-c", "--count", help="Number of greetings")
+
+
 @benchmark("@wargs decoration")
 def bench_wargs_decoration():
     """Benchmark applying @wargs decorator."""
@@ -155,6 +167,12 @@ def main():
     bench_resolve_literal()
     print()
 
+    print("Arg Metadata Benchmarks:")
+    print("-" * 40)
+    bench_arg_help_only()
+    bench_arg_with_flags()
+    print()
+
     print("Decorator Benchmarks:")
     print("-" * 40)
     bench_wargs_decoration()
@@ -775,3 +775,19 @@ class TestBuildParserConfig:
         config = build_parser_config(func_info, prefix=func_info.name)
 
         assert config.description == "First paragraph."
+
+    def test_help_options_passed_through(self) -> None:
+        """Test add_help and formatter_class are set on the config."""
+        func_info = FunctionInfo(name="greet", qualname="greet")
+
+        default = build_parser_config(func_info)
+        assert default.add_help is True
+        assert default.formatter_class is None
+
+        config = build_parser_config(
+            func_info,
+            add_help=False,
+            formatter_class="RawTextHelpFormatter",
+        )
+        assert config.add_help is False
+        assert config.formatter_class == "RawTextHelpFormatter"
@@ -1128,6 +1128,35 @@ class TestCompletionFlag:
         captured = capsys.readouterr()
         assert "#compdef myapp" in captured.out
 
+    def test_completion_does_not_build_parser(self, capsys) -> None:
+        """Test --completion uses the config without building argparse."""
+
+        @wArgs(prog="myapp", completion=True)
+        def cli(name: str) -> str:
+            return name
+
+        @wArgs(prog="myapp", completion=True)
+        class CLI:
+            def add(self, name: str) -> str:
+                return name
+
+        cli.run(["--completion", "bash"])
+        CLI.run(["--completion", "bash"])
+
+        assert cli._parser is None
+        assert CLI._parser is None
+        assert "--name" in capsys.readouterr().out
+
+    def test_requested_completion_shell(self) -> None:
+        """Test the pre-parse --completion scan."""
+        from wArgs.decorator import _requested_completion_shell
+
+        assert _requested_completion_shell(["--completion", "zsh"]) == "zsh"
+        assert _requested_completion_shell(["-v", "--completion", "fish"]) == "fish"
+        assert _requested_completion_shell(["--completion", "tcsh"]) is None
+        assert _requested_completion_shell(["--completion"]) is None
+        assert _requested_completion_shell(["--name", "x"]) is None
+
     def test_completion_flag_not_added_by_default(self) -> None:
         """Test --completion flag is not added when completion=False."""
 
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import pytest
+
 from wArgs.converters.registry import (
     ConverterRegistry,
     converter,
@@ -298,3 +300,24 @@ class TestLoadEntryPoints:
             # Can load again after clear
             registry.load_entry_points()
             assert mock_eps.call_count == 2
+
+
+class TestPackageReexports:
+    """Tests for lazy re-exports from wArgs.converters."""
+
+    def test_reexports_resolve(self) -> None:
+        """Names in __all__ should resolve to the defining objects."""
+        import wArgs.converters as converters
+        from wArgs.converters import builtin
+
+        for name in converters.__all__:
+            assert getattr(converters, name) is not None
+        assert converters.convert_uuid is builtin.convert_uuid
+        assert converters.ConverterRegistry is ConverterRegistry
+
+    def test_unknown_attribute_raises(self) -> None:
+        """Unknown names should raise AttributeError."""
+        import wArgs.converters as converters
+
+        with pytest.raises(AttributeError):
+            converters.does_not_exist  # noqa: B018
@@ -2,6 +2,12 @@
 
 from __future__ import annotations
 
+import copy
+import sys
+from typing import Any
+
+import pytest
+
 from wArgs import wArgs
 from wArgs.core.groups import CommandInfo, WargsGroup
 
@@ -214,6 +220,27 @@ class TestNestedGroups:
 
         assert "migrate" in cli.subgroups["db"].commands
 
+    def test_subgroup_usage_includes_program_name(self, capsys, monkeypatch) -> None:
+        """Test nested help names the program, not just the subgroup."""
+        monkeypatch.setattr(sys, "argv", ["myapp"])
+
+        @wArgs.group()
+        def cli() -> None:
+            pass
+
+        @cli.group()
+        def db() -> None:
+            """Database operations."""
+
+        @db.command()
+        def migrate() -> None:
+            """Run migrations."""
+
+        with pytest.raises(SystemExit):
+            cli.run(["db", "--help"])
+
+        assert "usage: myapp db " in capsys.readouterr().out
+
 
 class TestGroupParser:
     """Tests for group parser building."""
@@ -289,6 +316,55 @@ class TestGroupCompletion:
         captured = capsys.readouterr()
         assert "myapp" in captured.out
 
+    def test_completion_script_cached_until_registration(self, capsys) -> None:
+        """Test completion scripts are reused until a command is added."""
+
+        @wArgs.group(prog="myapp", completion=True)
+        def cli() -> None:
+            pass
+
+        @cli.command()
+        def hello() -> None:
+            pass
+
+        cli.run(["--completion", "bash"])
+        first = capsys.readouterr().out
+        cli.run(["--completion", "bash"])
+        assert capsys.readouterr().out == first
+        assert cli._completion_scripts["bash"] in first
+
+        @cli.command()
+        def goodbye() -> None:
+            pass
+
+        cli.run(["--completion", "bash"])
+        assert "goodbye" in capsys.readouterr().out
+
+    def test_completion_script_cleared_by_nested_registration(self, capsys) -> None:
+        """Test registering in a nested subgroup clears enclosing caches."""
+
+        @wArgs.group(prog="myapp", completion=True)
+        def cli() -> None:
+            pass
+
+        @cli.group()
+        def db() -> None:
+            pass
+
+        @db.group()
+        def users() -> None:
+            pass
+
+        cli.run(["--completion", "bash"])
+        capsys.readouterr()
+        assert "bash" in cli._completion_scripts
+
+        @users.command()
+        def add() -> None:
+            pass
+
+        assert cli._completion_scripts == {}
+
 
 class TestCommandInfo:
     """Tests for CommandInfo dataclass."""
@@ -306,6 +382,22 @@ class TestCommandInfo:
         assert info.description == ""
         assert info.config is None
 
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="slots=True needs 3.10+")
+    def test_command_info_has_no_dict(self) -> None:
+        """Test CommandInfo instances are slotted."""
+        info = CommandInfo(name="test", func=print)
+
+        assert not hasattr(info, "__dict__")
+
+    def test_command_info_compared_by_identity(self) -> None:
+        """Test CommandInfo uses identity equality and is hashable."""
+        first = CommandInfo(name="test", func=print)
+        second = CommandInfo(name="test", func=print)
+
+        assert first == first
+        assert first != second
+        assert len({first, second}) == 2
+
 
 class TestGroupRepr:
     """Tests for group representation."""
@@ -551,6 +643,19 @@ class TestBuildAddArgumentKwargs:
 
         assert kwargs.get("dest") == "output_file"
 
+    def test_build_kwargs_cached_on_config(self) -> None:
+        """Test kwargs are computed once per config."""
+        from wArgs.core.config import ArgumentConfig
+        from wArgs.core.groups import _build_add_argument_kwargs
+
+        config = ArgumentConfig(name="count", type=int, default=1)
+
+        kwargs = _build_add_argument_kwargs(config)
+
+        assert kwargs == {"type": int, "default": 1}
+        assert _build_add_argument_kwargs(config) is kwargs
+        assert config == ArgumentConfig(name="count", type=int, default=1)
+
 
 class TestGroupEdgeCases:
     """Tests for edge cases in groups."""
@@ -632,9 +737,287 @@ class TestGroupEdgeCases:
             calls.append("migrate")
             return "migrated"
 
-        # Force build the parser
-        _ = cli.parser
-        # Subgroup execution would need more complex routing
-        # For now, verify the structure is correct
-        assert "db" in cli.subgroups
-        assert "migrate" in cli.subgroups["db"].commands
+        @db.group()
+        def schema() -> None:
+            calls.append("schema")
+
+        @schema.command()
+        def dump(fmt: str = "sql") -> str:
+            calls.append("dump")
+            return fmt
+
+        assert cli.run(["db", "migrate"]) == "migrated"
+        assert calls == ["cli", "db", "migrate"]
+
+        calls.clear()
+        assert cli.run(["db", "schema", "dump", "--fmt", "json"]) == "json"
+        assert calls == ["cli", "db", "schema", "dump"]
+
+    def test_unrecognized_arguments_rejected(self) -> None:
+        """Test unknown arguments to a command still error."""
+
+        @wArgs.group()
+        def cli() -> None:
+            pass
+
+        @cli.command()
+        def hello() -> None:
+            pass
+
+        with pytest.raises(SystemExit):
+            cli.run(["hello", "--bogus"])
+
+    def test_subgroup_invocation_validated_before_callbacks(self, capsys) -> None:
+        """Test a bad subgroup invocation errors before any group function runs."""
+        calls = []
+
+        @wArgs.group(prog="myapp")
+        def cli(verbose: bool = False) -> None:
+            calls.append("cli")
+
+        @cli.group()
+        def db() -> None:
+            calls.append("db")
+
+        @db.command()
+        def migrate() -> None:
+            calls.append("migrate")
+
+        with pytest.raises(SystemExit):
+            cli.run(["db", "migrate", "--bogus"])
+        assert calls == []
+        assert "myapp db: error: unrecognized arguments: --bogus" in (
+            capsys.readouterr().err
+        )
+
+        with pytest.raises(SystemExit):
+            cli.run(["db", "nosuch"])
+        assert calls == []
+        assert "myapp db: error" in capsys.readouterr().err
+
+    def test_unknown_group_option_reported_by_group_parser(self, capsys) -> None:
+        """Test unknown options before a subgroup name are the group's error."""
+
+        @wArgs.group(prog="myapp")
+        def cli() -> None:
+            pass
+
+        @cli.group()
+        def db() -> None:
+            pass
+
+        @db.command()
+        def migrate() -> str:
+            return "migrated"
+
+        with pytest.raises(SystemExit):
+            cli.run(["--bogus", "db", "migrate"])
+        assert "myapp: error: unrecognized arguments: --bogus" in (
+            capsys.readouterr().err
+        )
+        # A valid invocation still dispatches to the subgroup
+        assert cli.run(["db", "migrate"]) == "migrated"
+
+    def test_command_description_from_docstring(self) -> None:
+        """Command descriptions use the first docstring line, or empty."""
+
+        @wArgs.group()
+        def cli() -> None:
+            pass
+
+        @cli.command()
+        def documented() -> None:
+            """Do the thing.
+
+            More detail.
+            """
+
+        @cli.command()
+        def undocumented() -> None:
+            pass
+
+        assert cli.commands["documented"].description == "Do the thing."
+        assert cli.commands["undocumented"].description == ""
+
+    def test_introspection_reused_across_rebuilds(self, monkeypatch) -> None:
+        """Registering more commands does not re-introspect earlier ones."""
+        import wArgs.core.groups as groups_module
+
+        calls: list[str] = []
+        original = groups_module.extract_function_info
+
+        def counting(func):
+            calls.append(func.__name__)
+            return original(func)
+
+        monkeypatch.setattr(groups_module, "extract_function_info", counting)
+
+        @wArgs.group()
+        def cli() -> None:
+            pass
+
+        @cli.command()
+        def first(name: str = "a") -> str:
+            return name
+
+        _ = cli._wargs_config
+
+        @cli.command()
+        def second(count: int = 1) -> int:
+            return count
+
+        _ = cli._wargs_config
+
+        assert calls.count("cli") == 1
+        assert calls.count("first") == 1
+        assert calls.count("second") == 1
+
+    def test_registration_extends_built_parser(self) -> None:
+        """Test registering after the parser is built adds to it in place."""
+
+        @wArgs.group()
+        def cli() -> None:
+            pass
+
+        @cli.command()
+        def first(name: str = "a") -> str:
+            return name
+
+        parser = cli.parser
+
+        @cli.command()
+        def second(count: int = 1) -> int:
+            return count
+
+        @cli.group()
+        def sub() -> None:
+            pass
+
+        assert cli.parser is parser
+        assert cli.parse_args(["second", "--count", "3"]).count == 3
+        assert set(cli._wargs_config.subcommands) == {"first", "second"}
+        assert cli.parse_args(["sub"]).command == "sub"
+
+    def test_reregistering_command_rebuilds_parser(self) -> None:
+        """Test replacing an existing command still rebuilds the parser."""
+
+        @wArgs.group()
+        def cli() -> None:
+            pass
+
+        @cli.command(name="run")
+        def run_a(name: str = "a") -> str:
+            return name
+
+        parser = cli.parser
+
+        @cli.command(name="run")
+        def run_b(count: int = 1) -> int:
+            return count
+
+        assert cli.parser is not parser
+        assert cli.parse_args(["run", "--count", "3"]).count == 3
+
+    def test_commands_introspected_only_when_selected(self, monkeypatch) -> None:
+        """Test a command's arguments are built only when it is parsed."""
+        import wArgs.core.groups as groups_module
+
+        calls: list[str] = []
+        original = groups_module.extract_function_info
+
+        def counting(func):
+            calls.append(func.__name__)
+            return original(func)
+
+        monkeypatch.setattr(groups_module, "extract_function_info", counting)
+
+        @wArgs.group()
+        def cli() -> None:
+            pass
+
+        @cli.command()
+        def first(name: str = "a") -> str:
+            return name
+
+        @cli.command()
+        def second(count: int = 1) -> int:
+            return count
+
+        cli.parse_args([])
+        assert calls == ["cli"]
+
+        assert cli.run(["second", "--count", "4"]) == 4
+        assert calls == ["cli", "second"]
+
+    def test_public_parser_has_every_command(self) -> None:
+        """Test the parser property exposes fully built command parsers."""
+
+        @wArgs.group()
+        def cli() -> None:
+            pass
+
+        @cli.command()
+        def add(name: str = "a") -> None:
+            """Add an item."""
+
+        cli.run(["add"])
+
+        @cli.command()
+        def remove(item_id: int = 0) -> None:
+            """Remove an item."""
+
+        subparsers = cli.parser._subparsers._group_actions[0]
+        add_help = subparsers.choices["add"].format_help()
+        assert "--name" in add_help
+        assert "Add an item." in add_help
+        assert "--item-id" in subparsers.choices["remove"].format_help()
+
+    def test_group_exposes_function_metadata(self) -> None:
+        """Test a group looks like the function it wraps."""
+
+        @wArgs.group()
+        def my_cli() -> None:
+            """My CLI."""
+
+        assert my_cli.__name__ == "my_cli"
+        assert my_cli.__qualname__.endswith("my_cli")
+        assert my_cli.__doc__ == "My CLI."
+        assert my_cli.__module__ == __name__
+        assert my_cli.__wrapped__ is my_cli.func
+        with pytest.raises(AttributeError):
+            _ = my_cli.missing
+
+    def test_group_exposes_function_attributes(self) -> None:
+        """Test attributes set on the group function are reachable on the group."""
+
+        def tag(func: Any) -> Any:
+            func.custom = "tagged"
+            return func
+
+        @wArgs.group()
+        @tag
+        def my_cli(verbose: bool = False) -> None:
+            pass
+
+        assert my_cli.custom == "tagged"
+        assert my_cli.__annotations__ == my_cli.func.__annotations__
+        assert copy.copy(my_cli).func is my_cli.func
+
+    def test_kwargs_skip_none_and_unparsed_values(self) -> None:
+        """Test kwargs extraction omits None and names missing from namespace."""
+        import argparse
+
+        from wArgs.core.config import ArgumentConfig, ParserConfig
+        from wArgs.core.groups import _make_kwargs_reader
+
+        config = ParserConfig(
+            arguments=[ArgumentConfig(name="a"), ArgumentConfig(name="b")]
+        )
+        read = _make_kwargs_reader(config)
+
+        assert read(argparse.Namespace(a=1, b=None)) == {"a": 1}
+        assert read(argparse.Namespace(b=2)) == {"b": 2}
+        assert _make_kwargs_reader(ParserConfig())(argparse.Namespace()) == {}
+
+        single = _make_kwargs_reader(ParserConfig(arguments=[ArgumentConfig("a")]))
+        assert single(argparse.Namespace(a=3)) == {"a": 3}
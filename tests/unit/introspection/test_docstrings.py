@@ -7,6 +7,7 @@ from wArgs.introspection.docstrings import (
     DocstringInfo,
     detect_docstring_format,
     parse_docstring,
+    parse_docstring_for,
 )
 
 
@@ -67,6 +68,32 @@ class TestDetectDocstringFormat:
         """
         assert detect_docstring_format(docstring) == DocstringFormat.SPHINX
 
+    def test_detect_precedence_independent_of_order(self) -> None:
+        """Test Sphinx markers win even after Google or NumPy sections."""
+        docstring = """Summary.
+
+        Args:
+            a: Described Google-style.
+
+        Parameters
+        ----------
+        :param b: Described Sphinx-style.
+        """
+        assert detect_docstring_format(docstring) == DocstringFormat.SPHINX
+        # Dashes before the Parameters header still count as NumPy
+        assert (
+            detect_docstring_format("Args:\n---\nParameters\n") == DocstringFormat.NUMPY
+        )
+
+    def test_detect_prose_skips_marker_scan(self, monkeypatch) -> None:
+        """Test docstrings without colons or underlines skip the regex."""
+        from wArgs.introspection import docstrings
+
+        monkeypatch.setattr(docstrings, "_FORMAT_MARKERS_PATTERN", None)
+        detect = docstrings.detect_docstring_format.__wrapped__
+        assert detect("Just a summary.\n\nAnd prose.") == DocstringFormat.UNKNOWN
+        assert detect("Note: colons alone are not markers.") == DocstringFormat.UNKNOWN
+
     def test_detect_unknown(self) -> None:
         """Test detection of unknown format."""
         docstring = """Just a simple docstring without any special sections."""
@@ -139,6 +166,22 @@ class TestParseGoogleDocstring:
         info = parse_docstring(docstring)
         assert "continues on the next line" in info.params["name"]
 
+    def test_parse_args_continuation_after_blank_line(self) -> None:
+        """Test continuation lines after a blank line stay with their entry."""
+        docstring = """Summary.
+
+        Args:
+            name: First part.
+
+                Second part.
+            count: Number of items.
+        """
+        info = parse_docstring(docstring)
+        assert info.params == {
+            "name": "First part. Second part.",
+            "count": "Number of items.",
+        }
+
     def test_parse_returns(self) -> None:
         """Test parsing Returns section."""
         docstring = """Summary.
@@ -161,6 +204,16 @@ class TestParseGoogleDocstring:
         assert "ValueError" in info.raises
         assert "When the input is invalid." in info.raises["ValueError"]
 
+    def test_parse_sections_with_crlf_and_other_sections(self) -> None:
+        """Test section boundaries with CRLF lines and non-parsed sections."""
+        docstring = (
+            "Summary.\r\n\r\nArgs:\r\n    name: The name.\r\n"
+            "Note:\r\n    Not a parameter.\r\nReturns:\r\n    Greeting.\r\n"
+        )
+        info = parse_docstring(docstring)
+        assert list(info.params) == ["name"]
+        assert info.returns == "Greeting."
+
     def test_parse_full_docstring(self) -> None:
         """Test parsing complete Google docstring."""
         docstring = """Short summary of the function.
@@ -334,6 +387,33 @@ class TestParseSphinxDocstring:
         info = parse_docstring(docstring)
         assert "ValueError" in info.raises
 
+    def test_mixed_directives_single_scan(self) -> None:
+        """Test every directive kind is found, including after a bare one."""
+        docstring = """Summary.
+
+        :param name:
+        :returns: The result.
+        :raises ValueError: When invalid.
+        :raises KeyError: When missing.
+        """
+        info = parse_docstring(docstring)
+        assert "name" in info.params
+        assert info.returns == "The result."
+        assert info.raises == {
+            "ValueError": "When invalid.",
+            "KeyError": "When missing.",
+        }
+
+    def test_summary_skips_leading_directives(self) -> None:
+        """Test that the summary is not taken from a directive line."""
+        docstring = """:param name: The name.
+
+        Trailing prose.
+        """
+        info = parse_docstring(docstring)
+        assert info.summary == "Trailing prose."
+        assert info.params["name"] == "The name."
+
 
 class TestParseUnknownFormat:
     """Tests for parsing unknown format docstrings."""
@@ -356,6 +436,28 @@ class TestParseUnknownFormat:
         assert info.summary is None
         assert info.params == {}
 
+    def test_parse_cached_by_text(self, monkeypatch) -> None:
+        """Test the same docstring text is parsed once, with fresh results."""
+        from wArgs.introspection import docstrings
+
+        doc = """Cached summary.
+
+        Args:
+            name: The name.
+        """
+
+        def fail(*args: object) -> DocstringInfo:
+            raise AssertionError("re-parsed")
+
+        first = parse_docstring(doc)
+        monkeypatch.setattr(docstrings, "_parse_google_docstring", fail)
+        second = parse_docstring(doc)
+
+        assert second == first
+        assert second is not first
+        second.params["other"] = "changed"
+        assert "other" not in parse_docstring(doc).params
+
     def test_parse_none_docstring(self) -> None:
         """Test parsing None docstring."""
         info = parse_docstring(None)
@@ -363,6 +465,45 @@ class TestParseUnknownFormat:
         assert info.summary is None
 
 
+class TestParseDocstringFor:
+    """Tests for the per-function docstring cache."""
+
+    def test_result_reused_for_same_function(self) -> None:
+        """Test parsing the same function twice returns the cached info."""
+
+        def func(name: str) -> None:
+            """Do something.
+
+            Args:
+                name: The name.
+            """
+
+        info = parse_docstring_for(func)
+        assert info.params == {"name": "The name."}
+        assert parse_docstring_for(func) is info
+
+    def test_changed_docstring_reparsed(self) -> None:
+        """Test a replaced __doc__ invalidates the cached entry."""
+
+        def func(name: str) -> None:
+            """Args:
+            name: Old.
+            """
+
+        old = parse_docstring_for(func)
+        func.__doc__ = """Args:
+            name: New.
+        """
+        new = parse_docstring_for(func)
+        assert new is not old
+        assert new.params == {"name": "New."}
+
+    def test_unreferenceable_callable(self) -> None:
+        """Test callables without weakref support are parsed uncached."""
+        info = parse_docstring_for(len)
+        assert info.summary == "Return the number of items in a container."
+
+
 class TestDocstringInfo:
     """Tests for DocstringInfo dataclass."""
 
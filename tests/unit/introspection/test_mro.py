@@ -51,6 +51,22 @@ class TestGetInitParameters:
         params = get_init_parameters(Example)
         assert params[0].description == "Enable verbose mode."
 
+    def test_undocumented_init_skips_docstring_parse(self, monkeypatch) -> None:
+        """Test an __init__ without a docstring is not parsed."""
+        from wArgs.introspection import mro
+
+        def fail(docstring: str | None) -> None:
+            raise AssertionError("parsed")
+
+        monkeypatch.setattr(mro, "parse_docstring", fail)
+
+        class Example:
+            def __init__(self, verbose: bool = False) -> None:
+                pass
+
+        params = get_init_parameters(Example)
+        assert params[0].description is None
+
 
 class TestMergeParameters:
     """Tests for merge_parameters function."""
@@ -277,6 +293,27 @@ class TestGetInheritedFunctionInfo:
         assert "name" in names
         assert "debug" in names
 
+    def test_cached_per_class_and_warn_flag(self) -> None:
+        """Test the MRO is traversed once per class and warn setting."""
+
+        class Base:
+            def __init__(self, level: int = 0) -> None:
+                pass
+
+        class CLI(Base):
+            def __init__(self, level: str = "0") -> None:
+                super().__init__()
+
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            first = get_inherited_function_info(CLI)
+            again = get_inherited_function_info(CLI)
+        quiet = get_inherited_function_info(CLI, warn_on_conflict=False)
+
+        assert again is first
+        assert quiet.parameters[0].annotation is str
+        assert len(caught) == 1
+
 
 class TestMroCoverageGaps:
     """Additional tests for coverage gaps."""
@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
+import functools
+import inspect
 from pathlib import Path
+from typing import Any
 
 import pytest
 
 from wArgs.core.config import MISSING, ParameterKind
 from wArgs.core.exceptions import IntrospectionError
+from wArgs.introspection import signatures
 from wArgs.introspection.signatures import extract_function_info, extract_parameters
 
 
@@ -155,6 +159,11 @@ class TestExtractParameters:
         assert params[0].kind == ParameterKind.POSITIONAL_OR_KEYWORD
         assert params[1].kind == ParameterKind.KEYWORD_ONLY
 
+    def test_every_inspect_kind_converted(self) -> None:
+        """Test each inspect parameter kind maps to the same-named kind."""
+        for kind in inspect._ParameterKind:
+            assert signatures._convert_parameter_kind(kind).name == kind.name
+
     def test_complex_type_annotations(self) -> None:
         """Test complex type annotations are preserved."""
 
@@ -167,6 +176,36 @@ class TestExtractParameters:
         assert params[0].annotation == list[Path]
         assert params[1].annotation == dict[str, int]
 
+    def test_positional_only_parameters(self) -> None:
+        """Test positional-only parameters and tail defaults."""
+
+        def func(a: int, b: str = "x", /, c: float = 1.0) -> None:
+            pass
+
+        params = extract_parameters(func)
+        assert [p.kind for p in params] == [
+            ParameterKind.POSITIONAL_ONLY,
+            ParameterKind.POSITIONAL_ONLY,
+            ParameterKind.POSITIONAL_OR_KEYWORD,
+        ]
+        assert not params[0].has_default
+        assert params[1].default == "x"
+        assert params[2].default == 1.0
+
+    def test_wrapped_function_uses_signature(self) -> None:
+        """Test that functools.wraps wrappers report the wrapped parameters."""
+
+        def func(name: str, count: int = 1) -> None:
+            pass
+
+        @functools.wraps(func)
+        def wrapper(*args: object, **kwargs: object) -> None:
+            pass
+
+        params = extract_parameters(wrapper)
+        assert [p.name for p in params] == ["name", "count"]
+        assert params[1].default == 1
+
 
 class TestExtractFunctionInfo:
     """Tests for extract_function_info function."""
@@ -235,6 +274,32 @@ class TestExtractFunctionInfo:
         assert info.line_number is not None
         assert info.line_number > 0
 
+    def test_source_location_of_wrapped_function(self) -> None:
+        """Test that decorated functions report the original location."""
+
+        def decorator(f: Any) -> Any:
+            @functools.wraps(f)
+            def wrapper(*args: Any, **kwargs: Any) -> Any:
+                return f(*args, **kwargs)
+
+            return wrapper
+
+        def original(a: int) -> None:
+            pass
+
+        info = extract_function_info(decorator(original))
+        assert info.source_file == original.__code__.co_filename
+        assert info.line_number == original.__code__.co_firstlineno
+
+    def test_source_location_without_source_file(self) -> None:
+        """Test functions compiled from a string report no location."""
+        namespace: dict[str, Any] = {}
+        exec("def generated(a: int) -> None:\n    pass\n", namespace)
+
+        info = extract_function_info(namespace["generated"])
+        assert info.source_file is None
+        assert info.line_number is None
+
     def test_extract_module(self) -> None:
         """Test module information extraction."""
 
@@ -263,6 +328,68 @@ class TestExtractFunctionInfo:
         assert "Calculator" in info.qualname
         assert "add" in info.qualname
 
+    def test_results_cached_per_function(self) -> None:
+        """Test repeated extraction returns equal results."""
+
+        def func(a: int, b: str = "x") -> None:
+            pass
+
+        info = extract_function_info(func)
+        assert extract_function_info(func) == info
+        assert extract_parameters(func) == info.parameters
+
+    def test_cached_result_shared_until_function_changes(self) -> None:
+        """Test the cached result is reused until the docstring or defaults change."""
+
+        def func(a: int = 1) -> None:
+            """Old."""
+
+        info = extract_function_info(func)
+        assert extract_function_info(func) is info
+
+        func.__doc__ = "New."
+        redocumented = extract_function_info(func)
+        assert redocumented.description == "New."
+
+        func.__defaults__ = (2,)
+        assert extract_function_info(func).parameters[0].default == 2
+
+    def test_type_hints_resolved_once(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test parameters and return type share one get_type_hints call."""
+        calls: list[object] = []
+        original = signatures.get_type_hints
+
+        def counting(obj: Any, **kwargs: Any) -> dict[str, Any]:
+            calls.append(obj)
+            return original(obj, **kwargs)
+
+        monkeypatch.setattr(signatures, "get_type_hints", counting)
+
+        def func(a: int) -> str:
+            return str(a)
+
+        info = extract_function_info(func)
+        assert extract_function_info(func).return_type is str
+        assert info.return_type is str
+        assert calls == [func]
+
+    def test_unresolved_hints_not_cached(self) -> None:
+        """Test a failed forward reference is retried on the next call."""
+
+        def func(a: LaterDefined) -> None:  # noqa: F821
+            pass
+
+        first = extract_function_info(func)
+        assert first.parameters[0].annotation == "LaterDefined"
+
+        func.__globals__["LaterDefined"] = int
+        try:
+            second = extract_function_info(func)
+        finally:
+            del func.__globals__["LaterDefined"]
+        assert second is not first
+        assert second.parameters[0].annotation is int
+
 
 class TestIntrospectionErrors:
     """Tests for error handling in introspection."""
@@ -287,3 +414,22 @@ class TestIntrospectionErrors:
         obj = NotCallable()
         with pytest.raises(IntrospectionError):
             extract_function_info(obj)  # type: ignore[arg-type]
+
+
+class TestPackageReexports:
+    """Tests for lazy re-exports from wArgs.introspection."""
+
+    def test_reexports_resolve(self) -> None:
+        """Names in __all__ should resolve to the defining objects."""
+        import wArgs.introspection as introspection
+
+        for name in introspection.__all__:
+            assert getattr(introspection, name) is not None
+        assert introspection.extract_function_info is extract_function_info
+
+    def test_unknown_attribute_raises(self) -> None:
+        """Unknown names should raise AttributeError."""
+        import wArgs.introspection as introspection
+
+        with pytest.raises(AttributeError):
+            introspection.does_not_exist  # noqa: B018
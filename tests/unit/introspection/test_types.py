@@ -5,7 +5,7 @@ from __future__ import annotations
 import sys
 from enum import Enum
 from pathlib import Path
-from typing import Dict, List, Literal, Optional, Set, Tuple, Union
+from typing import Annotated, Dict, List, Literal, Optional, Set, Tuple, Union
 
 import pytest
 
@@ -212,6 +212,14 @@ class TestResolveEnumTypes:
         with pytest.raises(KeyError):
             info.converter("INVALID")
 
+    def test_enum_converter_reads_member_map(self) -> None:
+        """Test the converter looks names up in the enum's member map."""
+        from wArgs.introspection.types import _make_enum_converter
+
+        converter = _make_enum_converter(Color)
+        assert converter.__name__ == "convert"
+        assert converter("BLUE") is Color.BLUE
+
 
 class TestResolveUnionTypes:
     """Tests for resolving Union types."""
@@ -359,6 +367,16 @@ class TestResolveWithRegistry:
         assert info.converter is int  # Built-in, not custom
         assert info.converter("5") == 5  # Not 500
 
+    def test_collection_basic_element_not_overridden_by_registry(self) -> None:
+        """Test that basic element types also ignore the registry."""
+        from wArgs.converters.registry import ConverterRegistry
+
+        registry = ConverterRegistry()
+        registry.register(int, lambda s: int(s) * 100)
+
+        info = resolve_type(list[int], registry=registry)
+        assert info.converter is int
+
     def test_resolve_collection_element_with_registry(self) -> None:
         """Test that collection element types use registry converters."""
         from wArgs.converters.registry import ConverterRegistry
@@ -378,3 +396,68 @@ class TestResolveWithRegistry:
         info = resolve_type(list[Item], registry=registry)
         assert info.origin is list
         assert info.converter is item_converter
+
+
+class TestTypeInfoSharing:
+    """Tests for TypeInfo instance sharing."""
+
+    def test_identical_types_share_instance(self) -> None:
+        """Resolving the same plain type twice yields the same TypeInfo."""
+        assert resolve_type(int) is resolve_type(int)
+        assert resolve_type(Optional[str]) is resolve_type(Optional[str])
+
+    def test_basic_types_use_fast_path(self) -> None:
+        """Basic types resolve to their pre-built TypeInfo."""
+        from wArgs.introspection.types import _BASIC_TYPE_INFO, BASIC_TYPES
+
+        for basic_type, converter in BASIC_TYPES.items():
+            info = resolve_type(basic_type)
+            assert info is _BASIC_TYPE_INFO[id(basic_type)]
+            assert info.origin is basic_type
+            assert info.converter is converter
+            assert not info.is_optional
+
+    def test_literal_values_not_conflated(self) -> None:
+        """Literal values that compare equal keep their own identity."""
+        ints = resolve_type(Literal["a", 1])
+        bools = resolve_type(Literal["a", True])
+        assert type(ints.literal_values[1]) is int
+        assert bools.literal_values[1] is True
+
+    def test_resolved_annotations_cached(self, monkeypatch) -> None:
+        """Resolving the same annotation object again skips resolution."""
+        from wArgs.introspection import types
+
+        annotation = Optional[List[int]]
+        first = resolve_type(annotation)
+
+        def fail(annotation, registry):
+            raise AssertionError("re-resolved")
+
+        monkeypatch.setattr(types, "_resolve_type", fail)
+        assert resolve_type(annotation) is first
+
+    def test_equal_unions_keep_their_order(self) -> None:
+        """Unions that compare equal still resolve their own args."""
+        assert resolve_type(Union[int, str]).args == (int, str)
+        assert resolve_type(Union[str, int]).args == (str, int)
+
+    def test_resolved_cache_is_bounded(self) -> None:
+        """The resolution cache evicts old entries instead of growing."""
+        from wArgs.introspection import types
+
+        assert types._resolve_cached.cache_info().maxsize == 1024
+
+    def test_unhashable_annotation_resolved_uncached(self) -> None:
+        """Annotations with unhashable metadata are resolved every time."""
+        annotation = Annotated[int, {"unhashable": []}]
+        first = resolve_type(annotation)
+        assert resolve_type(annotation) == first
+        assert resolve_type(annotation) is not first
+
+    def test_unhashable_fields_fall_back(self) -> None:
+        """Unhashable field values still produce a TypeInfo."""
+        from wArgs.core.config import make_type_info
+
+        info = make_type_info(args=([],))  # type: ignore[arg-type]
+        assert info.args == ([],)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import sys
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -11,11 +12,18 @@ from wArgs.plugins import (
     ConverterPlugin,
     PluginError,
     PluginRegistry,
+    clear_entry_point_cache,
     discover_entry_points,
     get_plugin_registry,
 )
 
 
+@pytest.fixture(autouse=True)
+def _clear_entry_points_cache() -> None:
+    """Start each test without cached entry point lookups."""
+    clear_entry_point_cache()
+
+
 class TestConverterPlugin:
     """Tests for the ConverterPlugin protocol."""
 
@@ -94,6 +102,22 @@ class TestPluginRegistry:
         assert registry.get_loaded_plugins("wargs.converters") == ["test_plugin"]
         assert registry.get_failed_plugins("wargs.converters") == []
 
+    def test_load_converters_interns_names(self) -> None:
+        """Test that stored plugin names are interned."""
+        registry = PluginRegistry()
+        converter_registry = ConverterRegistry()
+
+        mock_ep = MagicMock()
+        mock_ep.name = "".join(["interned", "_plugin"])
+        mock_ep.load.return_value = lambda r: None
+
+        with patch("wArgs.plugins.registry.entry_points") as mock_eps:
+            mock_eps.return_value = [mock_ep]
+            registry.load_converters(converter_registry)
+
+        (name,) = registry.get_loaded_plugins("wargs.converters")
+        assert name is sys.intern("interned_plugin")
+
     def test_load_converters_failure_silent(self) -> None:
         """Test plugin loading failure with silent mode."""
         registry = PluginRegistry()
@@ -111,6 +135,26 @@ class TestPluginRegistry:
         assert registry.get_loaded_plugins("wargs.converters") == []
         assert len(registry.get_failed_plugins("wargs.converters")) == 1
         assert "bad_plugin" in registry.get_failed_plugins("wargs.converters")[0][0]
+        assert registry.get_failed_plugins("wargs.converters")[0][1] == (
+            "ImportError: Module not found"
+        )
+
+    def test_load_converters_failure_keeps_no_traceback(self) -> None:
+        """Test failed plugins are recorded without the failure's traceback."""
+        registry = PluginRegistry()
+
+        mock_ep = MagicMock()
+        mock_ep.name = "bad_plugin"
+        mock_ep.load.side_effect = ImportError("Module not found")
+
+        with patch("wArgs.plugins.registry.entry_points") as mock_eps:
+            mock_eps.return_value = [mock_ep]
+            registry.load_converters(ConverterRegistry())
+
+        ((name, error),) = registry._failed_plugins["wargs.converters"]
+        assert name == "bad_plugin"
+        assert isinstance(error, ImportError)
+        assert error.__traceback__ is None
 
     def test_load_converters_failure_raise(self) -> None:
         """Test plugin loading failure with raise_on_error=True."""
@@ -236,6 +280,26 @@ class TestDiscoverEntryPoints:
         assert result[0]["value"] == "pkg1.module:register"
         assert result[0]["group"] == "wargs.converters"
 
+    def test_discovery_cached_until_clear(self) -> None:
+        """Test entry points are looked up once per group until cleared."""
+        registry = PluginRegistry()
+
+        with patch("wArgs.plugins.registry.entry_points") as mock_eps:
+            mock_eps.return_value = []
+            discover_entry_points("wargs.converters")
+            registry.load_converters(ConverterRegistry())
+            PluginRegistry().load_converters(ConverterRegistry())
+            assert mock_eps.call_count == 1
+
+            # Clearing one registry leaves the shared lookups alone
+            registry.clear()
+            discover_entry_points("wargs.converters")
+            assert mock_eps.call_count == 1
+
+            clear_entry_point_cache()
+            discover_entry_points("wargs.converters")
+            assert mock_eps.call_count == 2
+
 
 class TestGetPluginRegistry:
     """Tests for the get_plugin_registry function."""
@@ -2,6 +2,11 @@
 
 from __future__ import annotations
 
+import inspect
+import sys
+
+import pytest
+
 from wArgs.core.config import (
     MISSING,
     FunctionInfo,
@@ -38,20 +43,21 @@ class TestParameterKind:
 
     def test_all_kinds_exist(self) -> None:
         """All expected parameter kinds should exist."""
-        assert ParameterKind.POSITIONAL_ONLY
-        assert ParameterKind.POSITIONAL_OR_KEYWORD
-        assert ParameterKind.VAR_POSITIONAL
-        assert ParameterKind.KEYWORD_ONLY
-        assert ParameterKind.VAR_KEYWORD
+        assert ParameterKind.POSITIONAL_ONLY is not None
+        assert ParameterKind.POSITIONAL_OR_KEYWORD is not None
+        assert ParameterKind.VAR_POSITIONAL is not None
+        assert ParameterKind.KEYWORD_ONLY is not None
+        assert ParameterKind.VAR_KEYWORD is not None
 
-    def test_kind_values(self) -> None:
-        """Kind values should be strings."""
-        assert ParameterKind.VAR_POSITIONAL.value == "var_positional"
-        assert ParameterKind.VAR_KEYWORD.value == "var_keyword"
+    def test_kind_values_match_inspect(self) -> None:
+        """Kind values should equal the same-named inspect.Parameter kinds."""
+        for kind in ParameterKind:
+            assert kind == getattr(inspect.Parameter, kind.name)
+        assert ParameterKind.POSITIONAL_ONLY != inspect.Parameter.VAR_KEYWORD
 
 
 class TestTypeInfo:
-    """Tests for TypeInfo dataclass."""
+    """Tests for TypeInfo."""
 
     def test_default_values(self) -> None:
         """TypeInfo should have sensible defaults."""
@@ -79,6 +85,16 @@ class TestTypeInfo:
         assert info.is_optional is True
         assert info.converter is str
 
+    def test_is_immutable(self) -> None:
+        """TypeInfo fields cannot be reassigned; use _replace instead."""
+        info = TypeInfo(origin=int, converter=int)
+        with pytest.raises(AttributeError):
+            info.origin = str  # type: ignore[misc]
+        optional = info._replace(is_optional=True)
+        assert optional.is_optional is True
+        assert optional.origin is int
+        assert info.is_optional is False
+
 
 class TestParameterInfo:
     """Tests for ParameterInfo dataclass."""
@@ -159,3 +175,67 @@ class TestFunctionInfo:
 
         info1.parameters.append(ParameterInfo(name="x"))
         assert len(info2.parameters) == 0
+
+
+class TestArgumentConfig:
+    """Tests for ArgumentConfig."""
+
+    def test_resolved_flags_from_flags(self) -> None:
+        """Explicit flags are used as-is."""
+        from wArgs.core.config import ArgumentConfig
+
+        config = ArgumentConfig(name="count", flags=["-c", "--count"])
+        assert config.resolved_flags == ("-c", "--count")
+
+    def test_resolved_flags_derived_from_name(self) -> None:
+        """Without flags, a long flag is derived from the name."""
+        from wArgs.core.config import ArgumentConfig
+
+        config = ArgumentConfig(name="dry_run")
+        assert config.resolved_flags == ("--dry-run",)
+
+
+class TestCoreReexports:
+    """Tests for lazy re-exports from wArgs.core."""
+
+    def test_reexports_resolve(self) -> None:
+        """Names in __all__ should resolve to the defining objects."""
+        import wArgs.core as core
+        from wArgs.core import config
+
+        for name in core.__all__:
+            assert getattr(core, name) is not None
+        assert core.ParserConfig is config.ParserConfig
+        assert core.MISSING is MISSING
+
+    def test_unknown_attribute_raises(self) -> None:
+        """Unknown names should raise AttributeError."""
+        import wArgs.core as core
+
+        with pytest.raises(AttributeError):
+            core.does_not_exist  # noqa: B018
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="slots=True needs 3.10+")
+class TestSlots:
+    """Tests for slotted configuration dataclasses."""
+
+    def test_config_instances_have_no_dict(self) -> None:
+        """Config dataclasses should not carry a per-instance __dict__."""
+        from wArgs.core.arg import Arg
+        from wArgs.core.config import ArgumentConfig, ParserConfig
+        from wArgs.core.exceptions import ErrorContext
+        from wArgs.introspection.docstrings import DocstringInfo
+
+        instances = [
+            TypeInfo(),
+            ParameterInfo(name="x"),
+            FunctionInfo(name="f", qualname="f"),
+            ArgumentConfig(name="x"),
+            ParserConfig(),
+            Arg(),
+            ErrorContext(function_name="f"),
+            DocstringInfo(),
+        ]
+        for instance in instances:
+            assert not hasattr(instance, "__dict__")
@@ -3,12 +3,16 @@
 from __future__ import annotations
 
 import argparse
+import gc
+import weakref
 from enum import Enum
-from typing import Annotated, Literal
+from typing import Annotated, Any, Literal
 
 import pytest
 
 from wArgs import Arg, WargsWrapper, wArgs
+from wArgs.introspection import signatures
+from wArgs.utilities import get_config
 
 
 # Define enums at module level so they work with from __future__ import annotations
@@ -81,6 +85,24 @@ class TestWargsDecoratorBasic:
         wrapped = wArgs(greet)
         assert wrapped.func is greet
 
+    def test_function_metadata_copied(self) -> None:
+        """Test the wrapper carries the function's metadata."""
+
+        def greet(name: str) -> str:
+            """Greet someone."""
+            return f"Hello, {name}!"
+
+        greet.custom = "value"  # type: ignore[attr-defined]
+        wrapped = wArgs(greet)
+
+        assert wrapped.__name__ == "greet"
+        assert wrapped.__qualname__ == greet.__qualname__
+        assert wrapped.__doc__ == "Greet someone."
+        assert wrapped.__module__ == __name__
+        assert wrapped.__wrapped__ is greet
+        assert wrapped.custom == "value"
+        assert "_parser" not in vars(wrapped)
+
 
 class TestWargsDecoratorParsing:
     """Tests for argument parsing with @wargs."""
@@ -226,6 +248,53 @@ class TestWargsDecoratorDocstrings:
         assert description is not None
         assert "Process the input data" in description
 
+    def test_docstring_not_parsed_without_parameters(self, monkeypatch) -> None:
+        """Test a function with no parameters skips docstring parsing."""
+        import wArgs.decorator as decorator_module
+
+        def fail(func):
+            raise AssertionError("docstring parsed")
+
+        monkeypatch.setattr(decorator_module, "parse_docstring_for", fail)
+
+        @wArgs
+        def status() -> str:
+            """Show the status.
+
+            Returns:
+                The status text.
+            """
+            return "ok"
+
+        assert status.run([]) == "ok"
+        assert status.parser.description.startswith("Show the status.")
+
+    def test_repeated_annotations_resolved_once(self, monkeypatch) -> None:
+        """Test each distinct annotation is resolved once per function."""
+        import wArgs.decorator as decorator_module
+
+        calls: list[object] = []
+        original = decorator_module.resolve_type
+
+        def counting(annotation):
+            calls.append(annotation)
+            return original(annotation)
+
+        monkeypatch.setattr(decorator_module, "resolve_type", counting)
+
+        @wArgs
+        def copy(src: str, dst: str, retries: int = 1, depth: int = 2) -> None:
+            """Copy a file.
+
+            Args:
+                src: Source path.
+                dst: Destination path.
+            """
+
+        help_text = copy.parser.format_help()
+        assert sorted(calls, key=str) == [int, str]
+        assert "Source path" in help_text
+
 
 class TestWargsDecoratorAnnotated:
     """Tests for Annotated type with Arg metadata."""
@@ -304,6 +373,82 @@ class TestWargsDecoratorOptions:
 
         assert process.parser.formatter_class is argparse.RawDescriptionHelpFormatter
 
+    def test_redecoration_reuses_introspection(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test decorating a function again reuses its introspection."""
+        calls: list[Any] = []
+        original = signatures.get_type_hints
+
+        def counting(obj: Any, **kwargs: Any) -> dict[str, Any]:
+            calls.append(obj)
+            return original(obj, **kwargs)
+
+        monkeypatch.setattr(signatures, "get_type_hints", counting)
+
+        def process(data: str) -> None:
+            pass
+
+        first = wArgs(process)
+        second = wArgs(process)
+        other = wArgs(prog="other")(process)
+
+        assert get_config(first) == get_config(second)
+        assert get_config(other).prog == "other"
+        assert calls == [process]
+        assert first.parser is not second.parser
+
+    def test_config_copied_per_wrapper(self) -> None:
+        """Test changing one wrapper's config leaves other wrappers alone."""
+
+        def process(data: str) -> None:
+            pass
+
+        first = wArgs(process)
+        second = wArgs(process)
+
+        config = get_config(first)
+        config.arguments[0].help = "changed"
+
+        assert get_config(second) is not config
+        assert get_config(second).arguments[0].help is None
+        assert get_config(wArgs(process)).arguments[0].help is None
+
+    def test_kwargs_converter_specialized(self) -> None:
+        """Test the per-function kwargs converter built from the config."""
+
+        @wArgs
+        def process(name: str, count: int = 1, label: str | None = None) -> None:
+            pass
+
+        process.parse_args(["--name", "x"])
+        convert = process._convert_kwargs
+        assert convert is not None
+        assert convert({"name": "x", "count": 2, "label": None}) == {
+            "name": "x",
+            "count": 2,
+        }
+        # Required parameters are passed even when None or missing
+        assert convert({"count": 3}) == {"name": None, "count": 3}
+
+    def test_dict_expansion_plan_precomputed(self) -> None:
+        """Test dict parameters are rebuilt from a plan formatted once."""
+
+        @wArgs
+        def process(opts: dict = {"alpha": 1, "beta": 2}) -> dict:  # noqa: B006
+            return opts
+
+        assert process._dict_plan == ()
+        assert process.run(["--opts-alpha", "5"]) == {"alpha": 5, "beta": 2}
+        assert process._dict_plan == (
+            (
+                "opts",
+                {"alpha": 1, "beta": 2},
+                (("alpha", "opts_alpha"), ("beta", "opts_beta")),
+            ),
+        )
+        assert process.run([]) == {"alpha": 1, "beta": 2}
+
 
 class TestWargsDecoratorEdgeCases:
     """Edge case tests for @wargs."""
@@ -439,6 +584,117 @@ class TestWargsDecoratorIntegration:
 class TestWargsClassDecorator:
     """Tests for class-based @wargs decorator."""
 
+    def test_init_signature_inspected_once(self, monkeypatch) -> None:
+        """Test __init__'s signature is not re-inspected on every run."""
+        import inspect
+
+        import wArgs.decorator as decorator_module
+
+        calls: list[object] = []
+        original = inspect.signature
+
+        def counting(obj, *args, **kwargs):
+            calls.append(obj)
+            return original(obj, *args, **kwargs)
+
+        @wArgs
+        class CLI:
+            def __init__(self, verbose: bool = False) -> None:
+                self.verbose = verbose
+
+            def show(self) -> bool:
+                return self.verbose
+
+        monkeypatch.setattr(decorator_module.inspect, "signature", counting)
+
+        assert CLI.run(["--verbose", "show"]) is True
+        calls.clear()
+        assert CLI.run(["show"]) is False
+        assert calls == []
+
+    def test_class_redecoration_reuses_introspection(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test wrapping a class again reuses its methods' introspection."""
+        calls: list[Any] = []
+        original = signatures.get_type_hints
+
+        def counting(obj: Any, **kwargs: Any) -> dict[str, Any]:
+            calls.append(obj)
+            return original(obj, **kwargs)
+
+        monkeypatch.setattr(signatures, "get_type_hints", counting)
+
+        class CLI:
+            def show(self) -> str:
+                return "shown"
+
+        first = wArgs(CLI)
+        second = wArgs(CLI)
+        other = wArgs(prog="other")(CLI)
+
+        assert get_config(first) == get_config(second)
+        assert get_config(other).prog == "other"
+        assert calls == [CLI.show]
+        assert first.parser is not second.parser
+        assert second.run(["show"]) == "shown"
+
+    def test_class_config_copied_per_wrapper(self) -> None:
+        """Test changing one wrapper's config leaves other wrappers alone."""
+
+        class CLI:
+            def show(self, name: str = "x") -> str:
+                return name
+
+        first = wArgs(CLI)
+        second = wArgs(CLI)
+
+        config = get_config(first)
+        config.subcommands["show"].arguments[0].help = "changed"
+
+        assert get_config(second) is not config
+        assert get_config(second).subcommands["show"].arguments[0].help is None
+        assert get_config(wArgs(CLI)).subcommands["show"].arguments[0].help is None
+
+    def test_introspection_cache_does_not_keep_class_alive(self) -> None:
+        """Test the introspection caches hold decorated classes weakly."""
+
+        class CLI:
+            def __init__(self, verbose: bool = False) -> None:
+                super().__init__()
+
+            def show(self) -> None:
+                pass
+
+        get_config(wArgs(CLI))
+        ref = weakref.ref(CLI)
+        del CLI
+        gc.collect()
+
+        assert ref() is None
+
+    def test_init_arguments_prefiltered(self) -> None:
+        """Test only __init__ options are kept for kwargs extraction."""
+
+        @wArgs
+        class CLI:
+            def __init__(
+                self,
+                verbose: bool = False,
+                opts: dict = {"depth": 1},  # noqa: B006
+            ) -> None:
+                self.verbose = verbose
+                self.opts = opts
+
+            def show(self) -> tuple:
+                return self.verbose, self.opts
+
+        assert CLI.run(["--verbose", "--opts-depth", "3", "show"]) == (
+            True,
+            {"depth": 3},
+        )
+        assert CLI._init_arg_names == ("verbose",)
+
     def test_class_decorator_basic(self) -> None:
         """Test basic class decoration."""
         from wArgs import WargsClassWrapper
@@ -548,6 +804,32 @@ class TestWargsClassDecorator:
 
         result = CLI.run(["add-item"])
         assert result == "added"
+        assert CLI._method_names == {"add-item": "add_item"}
+
+    def test_method_kinds_dispatched(self) -> None:
+        """Test plain, static and class methods all run as subcommands."""
+
+        @wArgs
+        class CLI:
+            def __init__(self, name: str = "cli") -> None:
+                self.name = name
+
+            def plain(self) -> str:
+                return f"plain {self.name}"
+
+            @staticmethod
+            def static() -> str:
+                return "static"
+
+            @classmethod
+            def klass(cls) -> str:
+                return f"class {cls.__name__}"
+
+        assert set(CLI._method_funcs) <= {"plain"}
+        assert CLI.run(["--name", "x", "plain"]) == "plain x"
+        assert CLI.run(["static"]) == "static"
+        assert CLI.run(["klass"]) == "class CLI"
+        assert set(CLI._method_funcs) == {"plain"}
 
     def test_direct_instantiation(self, monkeypatch) -> None:
         """Test that calling with explicit kwargs overrides CLI values."""
@@ -925,6 +1207,21 @@ class TestWargsDecoratorCoverageGaps:
         result = process()
         assert result == "processed: default"
 
+    def test_function_call_from_entry_point_helper(self, monkeypatch) -> None:
+        """Test a no-arg call from a console-script helper parses argv."""
+
+        @wArgs(prefix=True)
+        def app(name: str = "default") -> str:
+            return f"processed: {name}"
+
+        monkeypatch.setattr("sys.argv", ["test", "--app-name", "cli"])
+
+        # mypkg/cli.py: def main(): app()
+        cli: dict[str, Any] = {"__name__": "mypkg.cli", "app": app}
+        exec("def main():\n    return app()\n", cli)
+
+        assert cli["main"]() == "processed: cli"
+
     def test_class_with_formatter_class(self) -> None:
         """Test class decorator with formatter_class option."""
 
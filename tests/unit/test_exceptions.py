@@ -47,6 +47,21 @@ class TestErrorContext:
         assert "Function: minimal_function" in formatted
         assert "Parameter:" not in formatted
 
+    def test_is_frozen(self, sample_error_context: ErrorContext) -> None:
+        """Context is immutable so its cached location cannot go stale."""
+        import dataclasses
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            sample_error_context.line_number = 7  # type: ignore[misc]
+
+    def test_equality_ignores_cached_location(self) -> None:
+        """Contexts with the same fields compare and hash equal."""
+        a = ErrorContext(function_name="f", source_file="m.py", line_number=3)
+        b = ErrorContext(function_name="f", source_file="m.py", line_number=3)
+        assert a == b
+        assert hash(a) == hash(b)
+        assert "_location" not in repr(a)
+
 
 class TestWargsError:
     """Tests for the base WargsError exception."""
@@ -71,6 +86,14 @@ class TestWargsError:
         assert "test_param" in message
         assert "test_module.py:42" in message
 
+    def test_context_formatted_lazily(self, sample_error_context: ErrorContext) -> None:
+        """Context is only formatted when the error is rendered."""
+        error = WargsError("Something went wrong", context=sample_error_context)
+        assert error.args == ("Something went wrong",)
+        first = str(error)
+        assert "Location: test_module.py:42" in first
+        assert str(error) is first
+
     def test_can_be_caught_as_exception(self) -> None:
         """Verify WargsError can be caught as Exception."""
         with pytest.raises(Exception, match="test"):
@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 import argparse
-from typing import Annotated, Literal
+import functools
+from typing import Annotated, Any, Literal
 
 import pytest
 
@@ -11,6 +12,7 @@ from wArgs import Arg, wArgs
 from wArgs.core.config import ParserConfig
 from wArgs.utilities import (
     WARGS_DEBUG_VAR,
+    _reset_debug_cache,
     debug_print,
     explain,
     get_config,
@@ -19,6 +21,12 @@ from wArgs.utilities import (
 )
 
 
+@pytest.fixture(autouse=True)
+def _fresh_debug_setting() -> None:
+    """Read WARGS_DEBUG afresh in each test, after monkeypatching."""
+    _reset_debug_cache()
+
+
 class TestIsDebugEnabled:
     """Tests for is_debug_enabled function."""
 
@@ -101,6 +109,17 @@ class TestDebugPrint:
         assert "arg2" in captured.err
         assert "arg3" in captured.err
 
+    def test_debug_setting_read_once(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test the environment is only consulted again after a reset."""
+        monkeypatch.setenv(WARGS_DEBUG_VAR, "1")
+        assert is_debug_enabled() is True
+
+        monkeypatch.setenv(WARGS_DEBUG_VAR, "0")
+        assert is_debug_enabled() is True
+
+        _reset_debug_cache()
+        assert is_debug_enabled() is False
+
 
 class TestGetParser:
     """Tests for get_parser function."""
@@ -144,6 +163,20 @@ class TestGetParser:
         with pytest.raises(TypeError, match="Expected a @wargs decorated"):
             get_parser(regular_func)
 
+    def test_get_parser_rejects_function_wrapping_a_wrapper(self) -> None:
+        """Test functools.wraps over a wrapper does not pass as a wrapper."""
+
+        @wArgs
+        def my_func(name: str) -> str:
+            return name
+
+        @functools.wraps(my_func)
+        def outer(*args: Any, **kwargs: Any) -> Any:
+            return my_func(*args, **kwargs)
+
+        with pytest.raises(TypeError, match="Expected a @wargs decorated"):
+            get_parser(outer)
+
 
 class TestGetConfig:
     """Tests for get_config function."""
@@ -0,0 +1,40 @@
+"""Lazy re-exports for wArgs packages (PEP 562)."""
+
+from __future__ import annotations
+
+import importlib
+from typing import Any, Callable, Mapping, MutableMapping
+
+
+def _lazy_exports(
+    module_globals: MutableMapping[str, Any],
+    mapping: Mapping[str, str],
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Build a package's module ``__getattr__`` and ``__dir__``.
+
+    Args:
+        module_globals: The package's ``globals()``.
+        mapping: Each re-exported name mapped to the relative name of the
+            submodule that defines it, e.g. ``{"TypeInfo": ".config"}``.
+
+    Returns:
+        The ``(__getattr__, __dir__)`` pair to assign in the package.
+    """
+    package = module_globals["__name__"]
+
+    def __getattr__(name: str) -> Any:
+        """Import a re-exported name on first access and cache it."""
+        try:
+            module_name = mapping[name]
+        except KeyError:
+            raise AttributeError(
+                f"module {package!r} has no attribute {name!r}"
+            ) from None
+        value = getattr(importlib.import_module(module_name, package), name)
+        module_globals[name] = value
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(module_globals) | set(mapping))
+
+    return __getattr__, __dir__
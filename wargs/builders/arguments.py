@@ -385,6 +385,8 @@ def build_parser_config(
     prog: str | None = None,
     description: str | None = None,
     prefix: str | None = None,
+    add_help: bool = True,
+    formatter_class: str | None = None,
 ) -> ParserConfig:
     """Build ParserConfig from FunctionInfo.
 
@@ -393,6 +395,8 @@ def build_parser_config(
         prog: Program name override.
         description: Description override.
         prefix: Optional prefix for argument flags. If None, uses func_info.name.
+        add_help: Whether to add -h/--help option.
+        formatter_class: Help formatter class name.
 
     Returns:
         ParserConfig for building an ArgumentParser.
@@ -452,6 +456,8 @@ def build_parser_config(
         prog=prog,
         description=desc,
         arguments=arguments,
+        add_help=add_help,
+        formatter_class=formatter_class,
         dict_expansions=dict_expansions,
     )
 
@@ -6,6 +6,8 @@ Extracts subcommands from class methods and builds subparser configurations.
 from __future__ import annotations
 
 import inspect
+import sys
+from dataclasses import replace
 from typing import Any, Callable
 
 from wArgs.builders.arguments import build_parser_config
@@ -62,6 +64,32 @@ def extract_methods(cls: type) -> dict[str, Callable[..., Any]]:
     return methods
 
 
+def _resolve_parameters(
+    func_info: FunctionInfo, doc_params: dict[str, str]
+) -> FunctionInfo:
+    """Resolve parameter types and add docstring descriptions.
+
+    Extracted FunctionInfo is shared, so a resolved copy is returned.
+
+    Args:
+        func_info: The extracted function info.
+        doc_params: Parameter descriptions parsed from the docstring.
+
+    Returns:
+        FunctionInfo with type_info and descriptions filled in.
+    """
+    parameters = []
+    for param in func_info.parameters:
+        type_info = param.type_info
+        if param.annotation is not None:
+            type_info = resolve_type(param.annotation)
+        description = param.description
+        if description is None:
+            description = doc_params.get(param.name)
+        parameters.append(replace(param, type_info=type_info, description=description))
+    return replace(func_info, parameters=parameters)
+
+
 def extract_init_info(cls: type) -> FunctionInfo | None:
     """Extract FunctionInfo from class __init__ method.
 
@@ -85,14 +113,7 @@ def extract_init_info(cls: type) -> FunctionInfo | None:
     # Parse docstring for descriptions
     docstring_info = parse_docstring(func_info.description)
 
-    # Resolve types and add descriptions
-    for param in func_info.parameters:
-        if param.annotation is not None:
-            param.type_info = resolve_type(param.annotation)
-        if param.description is None and param.name in docstring_info.params:
-            param.description = docstring_info.params[param.name]
-
-    return func_info
+    return _resolve_parameters(func_info, docstring_info.params)
 
 
 def extract_method_info(method: Callable[..., Any]) -> FunctionInfo:
@@ -109,14 +130,7 @@ def extract_method_info(method: Callable[..., Any]) -> FunctionInfo:
     # Parse docstring for descriptions
     docstring_info = parse_docstring(func_info.description)
 
-    # Resolve types and add descriptions
-    for param in func_info.parameters:
-        if param.annotation is not None:
-            param.type_info = resolve_type(param.annotation)
-        if param.description is None and param.name in docstring_info.params:
-            param.description = docstring_info.params[param.name]
-
-    return func_info
+    return _resolve_parameters(func_info, docstring_info.params)
 
 
 def build_subcommand_config(
@@ -214,8 +228,9 @@ def build_subcommand_config(
 
         method_config = build_parser_config(method_info, prefix=this_method_prefix)
 
-        # Use method name (with underscores replaced by hyphens) as subcommand
-        subcommand_name = method_name.replace("_", "-")
+        # Use method name (with underscores replaced by hyphens) as subcommand;
+        # interned since it is the dispatch key looked up on every run
+        subcommand_name = sys.intern(method_name.replace("_", "-"))
         config.subcommands[subcommand_name] = method_config
 
     return config
@@ -99,7 +99,7 @@ def _extract_completion_option(arg_config: ArgumentConfig) -> CompletionOption:
     # Get choices
     choices: list[str] = []
     if arg_config.choices:
-        choices = [str(c) for c in arg_config.choices]
+        choices = [c if type(c) is str else str(c) for c in arg_config.choices]
 
     # Detect file/directory completion from type
     file_completion = False
@@ -198,7 +198,11 @@ def extract_completion_spec_from_parser(parser: ArgumentParser) -> CompletionSpe
         if hasattr(action, "const") and action.const is not None:
             takes_value = False
 
-        choices = [str(c) for c in action.choices] if action.choices else []
+        choices = (
+            [c if type(c) is str else str(c) for c in action.choices]
+            if action.choices
+            else []
+        )
 
         global_options.append(
             CompletionOption(
@@ -242,7 +246,10 @@ def extract_completion_spec_from_parser(parser: ArgumentParser) -> CompletionSpe
                                 description=sub_action.help or "",
                                 takes_value=sub_action.nargs != 0,
                                 choices=(
-                                    [str(c) for c in sub_action.choices]
+                                    [
+                                        c if type(c) is str else str(c)
+                                        for c in sub_action.choices
+                                    ]
                                     if sub_action.choices
                                     else []
                                 ),
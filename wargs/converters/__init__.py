@@ -5,30 +5,64 @@ This module provides:
 - converter: Decorator for registering converters
 - Built-in converters for datetime, date, time, UUID, Decimal, Path, etc.
 - Dataclass expansion support
+
+Public names are re-exported lazily (PEP 562), so importing the registry
+does not pull in the built-in converters' datetime, decimal, fractions
+and uuid dependencies until one of them is used.
 """
 
-from wArgs.converters.builtin import (
-    convert_complex,
-    convert_date,
-    convert_datetime,
-    convert_decimal,
-    convert_fraction,
-    convert_path,
-    convert_time,
-    convert_uuid,
-    register_builtin_converters,
-)
-from wArgs.converters.dataclasses import (
-    expand_dataclass,
-    is_dataclass_type,
-    reconstruct_dataclass,
-)
-from wArgs.converters.registry import (
-    Converter,
-    ConverterRegistry,
-    converter,
-    get_default_registry,
-)
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from wArgs._lazy import _lazy_exports
+
+if TYPE_CHECKING:
+    from wArgs.converters.builtin import (
+        convert_complex,
+        convert_date,
+        convert_datetime,
+        convert_decimal,
+        convert_fraction,
+        convert_path,
+        convert_time,
+        convert_uuid,
+        register_builtin_converters,
+    )
+    from wArgs.converters.dataclasses import (
+        expand_dataclass,
+        is_dataclass_type,
+        reconstruct_dataclass,
+    )
+    from wArgs.converters.registry import (
+        Converter,
+        ConverterRegistry,
+        converter,
+        get_default_registry,
+    )
+
+# Maps each re-exported name to the submodule that defines it
+_LAZY = {
+    "convert_complex": ".builtin",
+    "convert_date": ".builtin",
+    "convert_datetime": ".builtin",
+    "convert_decimal": ".builtin",
+    "convert_fraction": ".builtin",
+    "convert_path": ".builtin",
+    "convert_time": ".builtin",
+    "convert_uuid": ".builtin",
+    "register_builtin_converters": ".builtin",
+    "expand_dataclass": ".dataclasses",
+    "is_dataclass_type": ".dataclasses",
+    "reconstruct_dataclass": ".dataclasses",
+    "Converter": ".registry",
+    "ConverterRegistry": ".registry",
+    "converter": ".registry",
+    "get_default_registry": ".registry",
+}
+
+
+__getattr__, __dir__ = _lazy_exports(globals(), _LAZY)
 
 __all__ = [
     "Converter",
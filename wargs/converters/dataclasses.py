@@ -19,6 +19,8 @@ Example:
 from __future__ import annotations
 
 import dataclasses
+import sys
+from functools import lru_cache
 from typing import Any, get_type_hints
 
 from wArgs.core.config import ParameterInfo, ParameterKind
@@ -36,6 +38,25 @@ def is_dataclass_type(annotation: Any) -> bool:
     return dataclasses.is_dataclass(annotation) and isinstance(annotation, type)
 
 
+@lru_cache(maxsize=None)
+def _init_field_names(dataclass_type: type) -> tuple[str, ...]:
+    """Get the interned names of a dataclass's ``__init__`` fields.
+
+    Cached per type so repeated reconstruction skips ``dataclasses.fields``.
+
+    Args:
+        dataclass_type: The dataclass type.
+
+    Returns:
+        Tuple of field names accepted by ``__init__``, in definition order.
+    """
+    return tuple(
+        sys.intern(field.name)
+        for field in dataclasses.fields(dataclass_type)
+        if field.init
+    )
+
+
 def expand_dataclass(
     param_name: str,
     dataclass_type: type,
@@ -148,14 +169,11 @@ def reconstruct_dataclass(
     kwargs: dict[str, Any] = {}
     prefix_with_sep = f"{prefix}{separator}" if prefix else ""
 
-    for field in dataclasses.fields(dataclass_type):
-        if not field.init:
-            continue
-
-        full_name = f"{prefix_with_sep}{field.name}"
+    for field_name in _init_field_names(dataclass_type):
+        full_name = f"{prefix_with_sep}{field_name}"
 
         if full_name in values and values[full_name] is not None:
-            kwargs[field.name] = values[full_name]
+            kwargs[field_name] = values[full_name]
 
     return dataclass_type(**kwargs)
 
@@ -1,20 +1,49 @@
-"""Core wArgs functionality."""
-
-from wArgs.core.config import (
-    MISSING,
-    ArgumentConfig,
-    FunctionInfo,
-    ParameterInfo,
-    ParameterKind,
-    ParserConfig,
-    TypeInfo,
-)
-from wArgs.core.exceptions import (
-    ConfigurationError,
-    ConversionError,
-    IntrospectionError,
-    WargsError,
-)
+"""Core wArgs functionality.
+
+Public names are re-exported lazily (PEP 562) so importing ``wArgs.core``
+does not pull in ``config`` or ``exceptions`` until a name is first used.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from wArgs._lazy import _lazy_exports
+
+if TYPE_CHECKING:
+    from wArgs.core.config import (
+        MISSING,
+        ArgumentConfig,
+        FunctionInfo,
+        ParameterInfo,
+        ParameterKind,
+        ParserConfig,
+        TypeInfo,
+    )
+    from wArgs.core.exceptions import (
+        ConfigurationError,
+        ConversionError,
+        IntrospectionError,
+        WargsError,
+    )
+
+# Maps each re-exported name to the submodule that defines it
+_LAZY = {
+    "MISSING": ".config",
+    "ArgumentConfig": ".config",
+    "FunctionInfo": ".config",
+    "ParameterInfo": ".config",
+    "ParameterKind": ".config",
+    "ParserConfig": ".config",
+    "TypeInfo": ".config",
+    "ConfigurationError": ".exceptions",
+    "ConversionError": ".exceptions",
+    "IntrospectionError": ".exceptions",
+    "WargsError": ".exceptions",
+}
+
+
+__getattr__, __dir__ = _lazy_exports(globals(), _LAZY)
 
 __all__ = [
     "MISSING",
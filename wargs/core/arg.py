@@ -14,11 +14,20 @@ Use with typing.Annotated to configure CLI argument behavior:
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import Any
+import re
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
 
+from wArgs.core.config import _DATACLASS_SLOTS
 
-@dataclass(frozen=True)
+if TYPE_CHECKING:
+    from typing import Any
+
+# A valid short flag is a single dash followed by one non-dash character
+_is_short_flag = re.compile(r"-[^-]").fullmatch
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class Arg:
     """Metadata for configuring a CLI argument.
 
@@ -52,7 +61,7 @@ class Arg:
     action: str | None = None
     nargs: str | int | None = None
     const: Any = None
-    default: Any = field(default=None, repr=False)
+    default: Any = None
     required: bool | None = None
     dest: str | None = None
     group: str | None = None
@@ -64,16 +73,22 @@ class Arg:
 
     def __post_init__(self) -> None:
         """Validate Arg configuration."""
+        # Fast path: the common Arg(help=...) style has nothing to validate
+        if (
+            self.short is None
+            and self.long is None
+            and not self.positional
+            and not self.hidden
+        ):
+            return
+
         # Validate short flag format
-        if self.short is not None:
+        if self.short is not None and not _is_short_flag(self.short):
             if not self.short.startswith("-") or self.short.startswith("--"):
                 raise ValueError(
                     f"Short flag must start with single dash: {self.short!r}"
                 )
-            if len(self.short) != 2:
-                raise ValueError(
-                    f"Short flag must be exactly 2 characters: {self.short!r}"
-                )
+            raise ValueError(f"Short flag must be exactly 2 characters: {self.short!r}")
 
         # Validate long flag format
         if self.long is not None and not self.long.startswith("--"):
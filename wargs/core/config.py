@@ -6,28 +6,42 @@ metadata extracted during introspection.
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field
-from enum import Enum
-from typing import Any, Callable
+from enum import Enum, IntEnum
+from functools import lru_cache
+from typing import TYPE_CHECKING, NamedTuple
 
+if TYPE_CHECKING:
+    from typing import Any, Callable, Final
 
-class ParameterKind(Enum):
+# slots=True is only accepted by dataclass() on Python 3.10+
+_DATACLASS_SLOTS: dict[str, Any] = (
+    {"slots": True} if sys.version_info >= (3, 10) else {}
+)
+
+
+class ParameterKind(IntEnum):
     """Kind of function parameter.
 
     Maps to inspect.Parameter kinds but simplified for CLI purposes.
+    Values match the inspect.Parameter kind values, so ``ParameterKind(kind)``
+    converts an inspect kind and comparisons between the two agree.
     """
 
-    POSITIONAL_ONLY = "positional_only"
-    POSITIONAL_OR_KEYWORD = "positional_or_keyword"
-    VAR_POSITIONAL = "var_positional"  # *args
-    KEYWORD_ONLY = "keyword_only"
-    VAR_KEYWORD = "var_keyword"  # **kwargs
+    POSITIONAL_ONLY = 0
+    POSITIONAL_OR_KEYWORD = 1
+    VAR_POSITIONAL = 2  # *args
+    KEYWORD_ONLY = 3
+    VAR_KEYWORD = 4  # **kwargs
 
 
-@dataclass
-class TypeInfo:
+class TypeInfo(NamedTuple):
     """Information about a resolved type annotation.
 
+    Immutable once resolved, so it is a NamedTuple: cheap to build and
+    already slotted.
+
     Attributes:
         origin: The origin type (e.g., list for list[str]).
         args: Type arguments (e.g., (str,) for list[str]).
@@ -40,16 +54,64 @@ class TypeInfo:
     """
 
     origin: type | None = None
-    args: tuple[Any, ...] = field(default_factory=tuple)
+    args: tuple[Any, ...] = ()
     is_optional: bool = False
     is_literal: bool = False
-    literal_values: tuple[Any, ...] = field(default_factory=tuple)
+    literal_values: tuple[Any, ...] = ()
     is_enum: bool = False
     enum_class: type[Enum] | None = None
     converter: Callable[[str], Any] | None = None
 
 
-@dataclass
+_cached_type_info = lru_cache(maxsize=256)(TypeInfo)
+
+
+def make_type_info(
+    origin: type | None = None,
+    args: tuple[Any, ...] = (),
+    is_optional: bool = False,
+    is_literal: bool = False,
+    literal_values: tuple[Any, ...] = (),
+    is_enum: bool = False,
+    enum_class: type[Enum] | None = None,
+    converter: Callable[[str], Any] | None = None,
+) -> TypeInfo:
+    """Build a TypeInfo, sharing one instance per distinct set of fields.
+
+    Literal types are never shared: values such as ``1`` and ``True``
+    compare equal, so a cached instance could carry the wrong values.
+    Unhashable fields also fall back to a fresh instance.
+
+    Returns:
+        A TypeInfo with the given fields.
+    """
+    if not literal_values:
+        try:
+            return _cached_type_info(
+                origin,
+                args,
+                is_optional,
+                is_literal,
+                literal_values,
+                is_enum,
+                enum_class,
+                converter,
+            )
+        except TypeError:
+            pass
+    return TypeInfo(
+        origin,
+        args,
+        is_optional,
+        is_literal,
+        literal_values,
+        is_enum,
+        enum_class,
+        converter,
+    )
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class ParameterInfo:
     """Information about a function parameter.
 
@@ -78,12 +140,11 @@ class ParameterInfo:
 class _Missing:
     """Sentinel class for missing default values."""
 
-    _instance: _Missing | None = None
+    __slots__ = ()
 
     def __new__(cls) -> _Missing:
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-        return cls._instance
+        # The single instance is created below; every construction returns it
+        return MISSING
 
     def __repr__(self) -> str:
         return "<MISSING>"
@@ -92,10 +153,10 @@ class _Missing:
         return False
 
 
-MISSING = _Missing()
+MISSING: Final[_Missing] = object.__new__(_Missing)
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class FunctionInfo:
     """Information about a function or method.
 
@@ -122,7 +183,7 @@ class FunctionInfo:
     line_number: int | None = None
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class ArgumentConfig:
     """Configuration for a single CLI argument.
 
@@ -145,6 +206,13 @@ class ArgumentConfig:
         positional: Whether this is a positional argument.
         hidden: Whether to hide from help.
         skip: Whether to skip this argument entirely.
+        resolved_flags: The flags to register; ``flags`` or, when empty,
+            the ``--name`` long flag derived from the name. Computed once
+            at construction.
+
+    The keyword arguments for ``add_argument`` are computed once and cached
+    in ``_add_argument_kwargs``; the config is treated as immutable once it
+    has been added to a parser.
     """
 
     name: str
@@ -163,9 +231,18 @@ class ArgumentConfig:
     positional: bool = False
     hidden: bool = False
     skip: bool = False
+    resolved_flags: tuple[str, ...] = field(init=False, repr=False, compare=False)
+    _add_argument_kwargs: dict[str, Any] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
+    def __post_init__(self) -> None:
+        self.resolved_flags = (
+            tuple(self.flags) if self.flags else (f"--{self.name.replace('_', '-')}",)
+        )
 
-@dataclass
+
+@dataclass(**_DATACLASS_SLOTS)
 class DictExpansion:
     """Tracks a dict parameter that was expanded into multiple CLI args.
 
@@ -182,7 +259,7 @@ class DictExpansion:
     default_dict: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class ParserConfig:
     """Configuration for an ArgumentParser.
 
@@ -209,8 +286,45 @@ class ParserConfig:
     dict_expansions: dict[str, DictExpansion] = field(default_factory=dict)
 
 
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
+class ErrorContext:
+    """Context information for error messages.
+
+    Provides source location and parameter context for debugging.
+    The context is immutable, so the formatted location is computed once.
+    """
+
+    function_name: str
+    parameter_name: str | None = None
+    source_file: str | None = None
+    line_number: int | None = None
+    _location: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if self.source_file and self.line_number:
+            location = f"{self.source_file}:{self.line_number}"
+        elif self.source_file:
+            location = self.source_file
+        else:
+            location = "<unknown>"
+        object.__setattr__(self, "_location", location)
+
+    def format_location(self) -> str:
+        """Format the source location for display."""
+        return self._location
+
+    def format_context(self) -> str:
+        """Format the full context for display."""
+        parts = [f"Function: {self.function_name}"]
+        if self.parameter_name:
+            parts.append(f"Parameter: {self.parameter_name}")
+        parts.append(f"Location: {self._location}")
+        return "\n  ".join(parts)
+
+
 __all__ = [
     "DictExpansion",
+    "ErrorContext",
     "MISSING",
     "ArgumentConfig",
     "FunctionInfo",
@@ -218,4 +332,5 @@ __all__ = [
     "ParameterKind",
     "ParserConfig",
     "TypeInfo",
+    "make_type_info",
 ]
@@ -12,36 +12,23 @@ Exception Hierarchy:
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
 
+if TYPE_CHECKING:
+    from wArgs.core.config import ErrorContext
 
-@dataclass
-class ErrorContext:
-    """Context information for error messages.
 
-    Provides source location and parameter context for debugging.
-    """
-
-    function_name: str
-    parameter_name: str | None = None
-    source_file: str | None = None
-    line_number: int | None = None
+def __getattr__(name: str) -> Any:
+    """Lazily re-export ErrorContext, which lives in ``config``.
 
-    def format_location(self) -> str:
-        """Format the source location for display."""
-        if self.source_file and self.line_number:
-            return f"{self.source_file}:{self.line_number}"
-        elif self.source_file:
-            return self.source_file
-        return "<unknown>"
+    Keeping the dataclass out of this module means catching wArgs errors
+    does not require importing ``dataclasses``.
+    """
+    if name == "ErrorContext":
+        from wArgs.core.config import ErrorContext
 
-    def format_context(self) -> str:
-        """Format the full context for display."""
-        parts = [f"Function: {self.function_name}"]
-        if self.parameter_name:
-            parts.append(f"Parameter: {self.parameter_name}")
-        parts.append(f"Location: {self.format_location()}")
-        return "\n  ".join(parts)
+        return ErrorContext
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class WargsError(Exception):
@@ -67,7 +54,16 @@ class WargsError(Exception):
     ) -> None:
         self.message = message
         self.context = context
-        super().__init__(self._format_message())
+        self._formatted: str | None = None
+        super().__init__(message)
+
+    def __str__(self) -> str:
+        """Return the message with context, formatted on first use."""
+        if self.context is None:
+            return self.message
+        if self._formatted is None:
+            self._formatted = self._format_message()
+        return self._formatted
 
     def _format_message(self) -> str:
         """Format the complete error message with context."""
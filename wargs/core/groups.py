@@ -41,89 +41,262 @@ from __future__ import annotations
 import argparse
 import sys
 from argparse import ArgumentParser
-from dataclasses import dataclass
-from functools import wraps
-from typing import Any, Callable
+from dataclasses import dataclass, field, replace
+from functools import partial
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any, Callable, Sequence
 
 from wArgs.builders.arguments import build_parser_config
 from wArgs.builders.parser import build_parser
-from wArgs.core.config import ArgumentConfig, ParserConfig
+from wArgs.core.config import (
+    _DATACLASS_SLOTS,
+    ArgumentConfig,
+    FunctionInfo,
+    ParserConfig,
+)
+from wArgs.decorator import _requested_completion_shell
 from wArgs.introspection.docstrings import parse_docstring
 from wArgs.introspection.signatures import extract_function_info
 from wArgs.introspection.types import resolve_type
 from wArgs.utilities import debug_print
 
+# Function metadata a WargsGroup exposes as if it were the group function
+# (what functools.wraps would copy, apart from __doc__ and __module__)
+_FORWARDED_ATTRS = frozenset(
+    {"__name__", "__qualname__", "__annotations__", "__type_params__"}
+)
+
+# ArgumentConfig attributes passed through to add_argument when not None
+_KWARG_ATTRS = ("type", "default", "choices", "nargs")
+
+# ArgumentConfig attributes passed through to add_argument when truthy
+_TRUTHY_KWARG_ATTRS = ("action", "metavar")
+
+# Starting kwargs for hidden arguments
+_HIDDEN_KWARGS: dict[str, Any] = {"help": argparse.SUPPRESS}
+
+# Namespace attribute holding the arguments after a subgroup's name
+_SUBGROUP_ARGS_DEST = "_wargs_subgroup_args"
+
 
 def _build_add_argument_kwargs(config: ArgumentConfig) -> dict[str, Any]:
     """Build kwargs dict for add_argument.
 
+    The result is cached on the config, so rebuilding a parser reuses it.
+
     Args:
         config: The argument configuration.
 
     Returns:
         kwargs dict for add_argument.
     """
-    kwargs: dict[str, Any] = {}
+    kwargs = config._add_argument_kwargs
+    if kwargs is not None:
+        return kwargs
 
-    # Type converter
-    if config.type is not None:
-        kwargs["type"] = config.type
+    # Hidden arguments are suppressed from help regardless of help text
+    if config.hidden:
+        kwargs = _HIDDEN_KWARGS.copy()
+    else:
+        kwargs = {"help": config.help} if config.help else {}
+
+    for attr in _KWARG_ATTRS:
+        value = getattr(config, attr)
+        if value is not None:
+            kwargs[attr] = value
+    for attr in _TRUTHY_KWARG_ATTRS:
+        value = getattr(config, attr)
+        if value:
+            kwargs[attr] = value
+
+    # required and dest only apply to optional arguments
+    if not config.positional:
+        if config.required:
+            kwargs["required"] = True
+        if config.dest:
+            kwargs["dest"] = config.dest
+
+    config._add_argument_kwargs = kwargs
+    return kwargs
 
-    # Default value
-    if config.default is not None:
-        kwargs["default"] = config.default
 
-    # Required (only for optional arguments)
-    if not config.positional and config.required:
-        kwargs["required"] = True
+def _add_command_arguments(parser: ArgumentParser, config: ParserConfig) -> None:
+    """Add a command's arguments to its subparser.
 
-    # Help text
-    if config.help:
-        if config.hidden:
-            kwargs["help"] = argparse.SUPPRESS
+    Args:
+        parser: The command's subparser.
+        config: The command's parser configuration.
+    """
+    for arg_config in config.arguments:
+        kwargs = _build_add_argument_kwargs(arg_config)
+        if arg_config.positional:
+            parser.add_argument(arg_config.name, **kwargs)
         else:
-            kwargs["help"] = config.help
-    elif config.hidden:
-        kwargs["help"] = argparse.SUPPRESS
+            parser.add_argument(*arg_config.resolved_flags, **kwargs)
+
+
+def _resolve_function_info(func: Callable[..., Any]) -> FunctionInfo:
+    """Introspect a function and resolve its parameter types and descriptions.
 
-    # Choices
-    if config.choices is not None:
-        kwargs["choices"] = config.choices
+    Args:
+        func: The group or command function.
+
+    Returns:
+        FunctionInfo with type_info and docstring descriptions filled in.
+    """
+    func_info = extract_function_info(func)
+    docstring_info = parse_docstring(func_info.description)
 
-    # Action
-    if config.action:
-        kwargs["action"] = config.action
+    # The extracted info is shared, so resolve into new parameters
+    parameters = []
+    for param in func_info.parameters:
+        type_info = param.type_info
+        if param.annotation is not None:
+            type_info = resolve_type(param.annotation)
+        description = param.description
+        if description is None:
+            description = docstring_info.params.get(param.name)
+        parameters.append(replace(param, type_info=type_info, description=description))
 
-    # nargs
-    if config.nargs is not None:
-        kwargs["nargs"] = config.nargs
+    return replace(func_info, parameters=parameters)
 
-    # metavar
-    if config.metavar:
-        kwargs["metavar"] = config.metavar
 
-    # dest (only for optional arguments)
-    if config.dest and not config.positional:
-        kwargs["dest"] = config.dest
+def _make_kwargs_reader(config: ParserConfig) -> Callable[[Any], dict[str, Any]]:
+    """Build a function that extracts a config's argument values from a namespace.
 
-    return kwargs
+    The argument names and an ``attrgetter`` over them are computed once, so
+    each call is a single batched attribute fetch.
+
+    Args:
+        config: The group or command parser configuration.
+
+    Returns:
+        Function mapping a namespace to kwargs, omitting None values.
+    """
+    names = tuple(arg.name for arg in config.arguments)
+    if not names:
+        return lambda _namespace: {}
+
+    getter = attrgetter(*names)
+    single = len(names) == 1
+
+    def read(namespace: Any) -> dict[str, Any]:
+        try:
+            values = getter(namespace)
+        except AttributeError:
+            # Some names were not parsed into the namespace
+            values = tuple(getattr(namespace, name, None) for name in names)
+        else:
+            if single:
+                values = (values,)
+        return {name: value for name, value in zip(names, values) if value is not None}
+
+    return read
 
 
-@dataclass
+def _first_doc_line(func: Callable[..., Any]) -> str:
+    """Get the first line of a function's docstring.
+
+    Returns an empty string when there is no docstring (including under
+    ``python -OO``, where docstrings are stripped).
+    """
+    doc = func.__doc__
+    if not doc:
+        return ""
+    return doc.partition("\n")[0].strip()
+
+
+if TYPE_CHECKING:
+    _SubParsersAction = argparse._SubParsersAction[ArgumentParser]
+else:
+    _SubParsersAction = argparse._SubParsersAction
+
+
+class _LazySubparserAction(_SubParsersAction):
+    """Subparsers action that adds a command's arguments only when it is selected.
+
+    Commands are registered as bare placeholder subparsers together with a
+    callback that populates them; the callback runs the first time the
+    command is parsed, so unused commands are never introspected.
+
+    Subgroups parse their own arguments: for those, the arguments after
+    the name are stored on the namespace instead of being parsed here.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._pending: dict[str, Callable[[ArgumentParser], None]] = {}
+        self._passthrough: set[str] = set()
+
+    def add_lazy_parser(
+        self,
+        name: str,
+        populate: Callable[[ArgumentParser], None],
+        **kwargs: Any,
+    ) -> ArgumentParser:
+        """Add a placeholder subparser populated by ``populate`` on first use."""
+        subparser = self.add_parser(name, **kwargs)
+        self._pending[name] = populate
+        return subparser
+
+    def add_passthrough_parser(self, name: str, **kwargs: Any) -> ArgumentParser:
+        """Add a subparser whose arguments are left for another parser."""
+        subparser = self.add_parser(name, **kwargs)
+        self._passthrough.add(name)
+        return subparser
+
+    def materialize(self, name: str) -> None:
+        """Populate the named subparser if it is still a placeholder."""
+        populate = self._pending.pop(name, None)
+        if populate is not None:
+            populate(self._name_parser_map[name])
+
+    def materialize_all(self) -> None:
+        """Populate every remaining placeholder subparser."""
+        for name in list(self._pending):
+            self.materialize(name)
+
+    def __call__(
+        self,
+        parser: ArgumentParser,
+        namespace: argparse.Namespace,
+        values: str | Sequence[Any] | None,
+        option_string: str | None = None,
+    ) -> None:
+        if values:
+            name = values[0]
+            if name in self._passthrough:
+                setattr(namespace, self.dest, name)
+                setattr(namespace, _SUBGROUP_ARGS_DEST, list(values[1:]))
+                return
+            self.materialize(name)
+        super().__call__(parser, namespace, values, option_string)
+
+
+@dataclass(eq=False, **_DATACLASS_SLOTS)
 class CommandInfo:
     """Information about a registered command.
 
+    Compared by identity: it carries caches filled in as the parser is
+    built, and two registrations are never interchangeable.
+
     Attributes:
         name: Command name (derived from function name).
         func: The command function.
         description: Command description.
         config: Parser configuration for this command.
+        func_info: Resolved introspection of func, computed on first build.
+        kwargs_reader: Extracts func's kwargs from a namespace; set with config.
     """
 
     name: str
     func: Callable[..., Any]
     description: str = ""
     config: ParserConfig | None = None
+    func_info: FunctionInfo | None = None
+    kwargs_reader: Callable[[Any], dict[str, Any]] | None = field(
+        default=None, repr=False, compare=False
+    )
 
 
 class WargsGroup:
@@ -168,9 +341,36 @@ class WargsGroup:
         self._parser: ArgumentParser | None = None
         self._parser_config: ParserConfig | None = None
         self._group_config: ParserConfig | None = None
-
-        # Copy function metadata
-        wraps(func)(self)
+        self._group_kwargs_reader: Callable[[Any], dict[str, Any]] | None = None
+        self._completion_scripts: dict[str, str] = {}
+        # Enclosing group, set when created by another group's group()
+        self._parent: WargsGroup | None = None
+        self._group_func_info: FunctionInfo | None = None
+        self._subparsers: _LazySubparserAction | None = None
+
+        # The class defines __doc__ and __module__, so __getattr__ never sees them
+        self.__doc__ = func.__doc__
+        self.__module__ = func.__module__
+
+    def __getattr__(self, name: str) -> Any:
+        """Forward the group function's metadata and attributes.
+
+        Only called for names the group itself lacks: ``__name__`` and the
+        like, plus anything set on the function, e.g. by other decorators.
+        """
+        # _func is only missing before __init__ runs (e.g. in copy.copy)
+        if name == "_func":
+            raise AttributeError(name)
+        if name == "__wrapped__":
+            return self._func
+        if name in _FORWARDED_ATTRS:
+            return getattr(self._func, name)
+        func_dict = getattr(self._func, "__dict__", None)
+        if func_dict is not None and name in func_dict:
+            return func_dict[name]
+        raise AttributeError(
+            f"{type(self).__name__!r} object has no attribute {name!r}"
+        )
 
     @property
     def func(self) -> Callable[..., Any]:
@@ -189,7 +389,23 @@ class WargsGroup:
 
     @property
     def parser(self) -> ArgumentParser:
-        """Get or build the ArgumentParser (lazy construction)."""
+        """Get or build the ArgumentParser (lazy construction).
+
+        Every command's arguments are added, so the parser is complete for
+        introspection and help formatting.
+        """
+        parser = self._lazy_parser
+        if self._subparsers is not None:
+            self._subparsers.materialize_all()
+        return parser
+
+    @property
+    def _lazy_parser(self) -> ArgumentParser:
+        """Get or build the parser, leaving commands as placeholders.
+
+        Parsing populates only the command it selects, so run() and
+        parse_args() use this parser instead of the public one.
+        """
         if self._parser is None:
             self._build_parser()
         return self._parser  # type: ignore[return-value]
@@ -199,6 +415,16 @@ class WargsGroup:
         """Get the parser configuration (for debugging/testing)."""
         if self._parser_config is None:
             self._build_parser()
+        assert self._parser_config is not None
+
+        # Subcommand configs are only complete once every command is populated
+        if self._subparsers is not None:
+            self._subparsers.materialize_all()
+        self._parser_config.subcommands = {
+            name: cmd_info.config
+            for name, cmd_info in self._commands.items()
+            if cmd_info.config is not None
+        }
         return self._parser_config
 
     def command(
@@ -224,18 +450,25 @@ class WargsGroup:
         """
 
         def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
-            cmd_name = name or func.__name__.replace("_", "-")
-            description = help or (func.__doc__ or "").split("\n")[0].strip()
+            cmd_name = sys.intern(name or func.__name__.replace("_", "-"))
+            description = help or _first_doc_line(func)
 
-            self._commands[cmd_name] = CommandInfo(
+            cmd_info = CommandInfo(
                 name=cmd_name,
                 func=func,
                 description=description,
             )
-
-            # Invalidate cached parser
-            self._parser = None
-            self._parser_config = None
+            replacing = cmd_name in self._commands or cmd_name in self._subgroups
+            self._commands[cmd_name] = cmd_info
+            self._clear_completion_scripts()
+
+            if self._parser is not None:
+                if replacing:
+                    # argparse cannot replace a subparser; rebuild lazily
+                    self._parser = None
+                    self._parser_config = None
+                else:
+                    self._add_command_to_parser(cmd_info)
 
             return func
 
@@ -269,8 +502,8 @@ class WargsGroup:
         """
 
         def decorator(func: Callable[..., Any]) -> WargsGroup:
-            subgroup_name = name or func.__name__.replace("_", "-")
-            description = help or (func.__doc__ or "").split("\n")[0].strip()
+            subgroup_name = sys.intern(name or func.__name__.replace("_", "-"))
+            description = help or _first_doc_line(func)
 
             subgroup = WargsGroup(
                 func,
@@ -279,12 +512,21 @@ class WargsGroup:
                 add_help=self._add_help,
                 formatter_class=self._formatter_class,
             )
+            subgroup._parent = self
 
+            replacing = (
+                subgroup_name in self._commands or subgroup_name in self._subgroups
+            )
             self._subgroups[subgroup_name] = subgroup
+            self._clear_completion_scripts()
 
-            # Invalidate cached parser
-            self._parser = None
-            self._parser_config = None
+            if self._parser is not None:
+                if replacing:
+                    # argparse cannot replace a subparser; rebuild lazily
+                    self._parser = None
+                    self._parser_config = None
+                else:
+                    self._add_subgroup_to_parser(subgroup_name, subgroup)
 
             return subgroup
 
@@ -292,62 +534,49 @@ class WargsGroup:
 
     def _build_group_config(self) -> ParserConfig:
         """Build parser config from the group function."""
-        debug_print(f"Building group config for: {self._func.__name__}")
-
-        # Extract function info for the group function
-        func_info = extract_function_info(self._func)
+        if __debug__:
+            debug_print("Building group config for:", self._func.__name__)
 
-        # Parse docstring
-        docstring_info = parse_docstring(func_info.description)
-
-        # Resolve types and add descriptions
-        for param in func_info.parameters:
-            if param.annotation is not None:
-                param.type_info = resolve_type(param.annotation)
-            if param.description is None and param.name in docstring_info.params:
-                param.description = docstring_info.params[param.name]
+        # Introspect the group function once; reused across parser rebuilds
+        if self._group_func_info is None:
+            self._group_func_info = _resolve_function_info(self._func)
 
         # Build config
-        config = build_parser_config(
-            func_info,
+        return build_parser_config(
+            self._group_func_info,
             prog=self._prog,
             description=self._description,
+            add_help=self._add_help,
+            formatter_class=self._formatter_class or None,
         )
 
-        if self._formatter_class:
-            config.formatter_class = self._formatter_class
-        config.add_help = self._add_help
-
-        return config
-
     def _build_command_config(self, cmd_info: CommandInfo) -> ParserConfig:
         """Build parser config for a command."""
-        debug_print(f"Building command config for: {cmd_info.name}")
+        if __debug__:
+            debug_print("Building command config for:", cmd_info.name)
 
-        func_info = extract_function_info(cmd_info.func)
-        docstring_info = parse_docstring(func_info.description)
-
-        for param in func_info.parameters:
-            if param.annotation is not None:
-                param.type_info = resolve_type(param.annotation)
-            if param.description is None and param.name in docstring_info.params:
-                param.description = docstring_info.params[param.name]
+        # Introspect the command function once; reused across parser rebuilds
+        if cmd_info.func_info is None:
+            cmd_info.func_info = _resolve_function_info(cmd_info.func)
 
         config = build_parser_config(
-            func_info,
+            cmd_info.func_info,
             prog=f"{self._prog or ''} {cmd_info.name}".strip(),
             description=cmd_info.description,
         )
 
         cmd_info.config = config
+        cmd_info.kwargs_reader = _make_kwargs_reader(config)
         return config
 
     def _build_parser(self) -> None:
         """Build the parser with all commands as subparsers."""
-        debug_print(f"Building parser for group: {self._func.__name__}")
+        if __debug__:
+            debug_print("Building parser for group:", self._func.__name__)
 
         # Build group config (shared options)
         self._group_config = self._build_group_config()
+        self._group_kwargs_reader = _make_kwargs_reader(self._group_config)
 
         # Create main parser with group options
         self._parser = build_parser(self._group_config)
@@ -361,44 +590,6 @@ class WargsGroup:
                 help="Generate shell completion script and exit",
             )
 
-        # Add subparsers for commands
-        if self._commands or self._subgroups:
-            subparsers = self._parser.add_subparsers(
-                dest="command",
-                title="commands",
-                description="Available commands",
-            )
-
-            # Add commands
-            for cmd_name, cmd_info in self._commands.items():
-                cmd_config = self._build_command_config(cmd_info)
-                subparser = subparsers.add_parser(
-                    cmd_name,
-                    help=cmd_info.description,
-                    description=cmd_config.description,
-                )
-
-                # Add command arguments
-                for arg_config in cmd_config.arguments:
-                    kwargs = _build_add_argument_kwargs(arg_config)
-                    if arg_config.positional:
-                        subparser.add_argument(arg_config.name, **kwargs)
-                    else:
-                        flags = list(arg_config.flags) or [
-                            f"--{arg_config.name.replace('_', '-')}"
-                        ]
-                        subparser.add_argument(*flags, **kwargs)
-
-            # Add subgroups as nested commands
-            for subgroup_name, subgroup in self._subgroups.items():
-                # Force build subgroup parser
-                _ = subgroup.parser
-                subparsers.add_parser(
-                    subgroup_name,
-                    help=subgroup._description or "",
-                    add_help=False,
-                )
-
         # Create combined parser config for completion
         self._parser_config = ParserConfig(
             prog=self._group_config.prog,
@@ -407,10 +598,75 @@ class WargsGroup:
             add_help=self._add_help,
         )
 
-        # Add subcommand configs
-        for cmd_name, cmd_info in self._commands.items():
-            if cmd_info.config:
-                self._parser_config.subcommands[cmd_name] = cmd_info.config
+        # Add subparsers for commands, then subgroups as nested commands
+        self._subparsers = None
+        for cmd_info in self._commands.values():
+            self._add_command_to_parser(cmd_info)
+        for subgroup_name, subgroup in self._subgroups.items():
+            self._add_subgroup_to_parser(subgroup_name, subgroup)
+
+    def _get_subparsers(self) -> _LazySubparserAction:
+        """Get the built parser's subparsers action, creating it on first use."""
+        assert self._parser is not None
+
+        if self._subparsers is None:
+            self._subparsers = self._parser.add_subparsers(  # type: ignore[assignment]
+                action=_LazySubparserAction,
+                dest="command",
+                title="commands",
+                description="Available commands",
+            )
+        assert self._subparsers is not None
+        return self._subparsers
+
+    def _add_command_to_parser(self, cmd_info: CommandInfo) -> None:
+        """Add a command's placeholder subparser to the already-built parser."""
+        self._get_subparsers().add_lazy_parser(
+            cmd_info.name,
+            partial(self._populate_command_parser, cmd_info),
+            help=cmd_info.description,
+        )
+
+    def _populate_command_parser(
+        self, cmd_info: CommandInfo, subparser: ArgumentParser
+    ) -> None:
+        """Introspect a command and add its arguments to its subparser."""
+        cmd_config = self._build_command_config(cmd_info)
+        subparser.description = cmd_config.description
+        _add_command_arguments(subparser, cmd_config)
+
+    def _add_subgroup_to_parser(self, subgroup_name: str, subgroup: WargsGroup) -> None:
+        """Add a subgroup's placeholder subparser to the already-built parser."""
+        assert self._parser is not None
+        self._get_subparsers().add_passthrough_parser(
+            subgroup_name,
+            help=subgroup._description or "",
+            add_help=False,
+        )
+
+        # Name the subgroup after this parser's prog, which defaults to argv[0]
+        prog = f"{self._parser.prog} {subgroup_name}"
+        if subgroup._prog != prog:
+            subgroup._prog = prog
+            subgroup._parser = None
+            subgroup._parser_config = None
+
+    def _clear_completion_scripts(self) -> None:
+        """Drop cached completion scripts here and in every enclosing group."""
+        group: WargsGroup | None = self
+        while group is not None:
+            group._completion_scripts.clear()
+            group = group._parent
+
+    def _completion_script(self, shell: str) -> str:
+        """Get the completion script for a shell, generating it once."""
+        script = self._completion_scripts.get(shell)
+        if script is None:
+            from wArgs.completion import generate_completion
+
+            script = generate_completion(self, shell=shell)
+            self._completion_scripts[shell] = script
+        return script
 
     def parse_args(self, args: list[str] | None = None) -> Any:
         """Parse command-line arguments.
@@ -421,45 +677,60 @@ class WargsGroup:
         Returns:
             Namespace with parsed arguments.
         """
-        debug_print(f"Parsing args for group: {args}")
-        result = self.parser.parse_args(args)
-        debug_print(f"Parsed result: {result}")
+        if __debug__:
+            debug_print("Parsing args for group:", args)
+        result = self._lazy_parser.parse_args(args)
+        if __debug__:
+            debug_print("Parsed result:", result)
         return result
 
     def _get_group_kwargs(self, namespace: Any) -> dict[str, Any]:
         """Extract group function kwargs from namespace."""
-        kwargs: dict[str, Any] = {}
-
-        if self._group_config is None:
+        if self._group_kwargs_reader is None:
             self._build_parser()
 
-        assert self._group_config is not None
-
-        for arg in self._group_config.arguments:
-            value = getattr(namespace, arg.name, None)
-            if value is not None:
-                kwargs[arg.name] = value
-
-        return kwargs
+        assert self._group_kwargs_reader is not None
+        return self._group_kwargs_reader(namespace)
 
     def _get_command_kwargs(self, namespace: Any, cmd_name: str) -> dict[str, Any]:
         """Extract command kwargs from namespace."""
-        kwargs: dict[str, Any] = {}
-
         cmd_info = self._commands.get(cmd_name)
-        if cmd_info is None or cmd_info.config is None:
-            return kwargs
+        if cmd_info is None or cmd_info.kwargs_reader is None:
+            return {}
 
-        for arg in cmd_info.config.arguments:
-            value = getattr(namespace, arg.name, None)
-            if value is not None:
-                kwargs[arg.name] = value
+        return cmd_info.kwargs_reader(namespace)
 
-        return kwargs
+    def _parse_invocation(self, args: list[str] | None) -> list[tuple[WargsGroup, Any]]:
+        """Parse arguments for this group and every subgroup they select.
+
+        Each level is parsed by its own parser, so unknown arguments are
+        reported by the parser they were given to.
+
+        Args:
+            args: Arguments to parse. Defaults to sys.argv[1:].
+
+        Returns:
+            (group, namespace) pairs from this group down to the group
+            that owns the selected command.
+        """
+        chain: list[tuple[WargsGroup, Any]] = []
+        group = self
+        while True:
+            namespace = group.parse_args(args)
+            chain.append((group, namespace))
+            command = getattr(namespace, "command", None)
+            subgroup = group._subgroups.get(command) if command else None
+            if subgroup is None:
+                return chain
+            args = getattr(namespace, _SUBGROUP_ARGS_DEST)
+            group = subgroup
 
     def run(self, args: list[str] | None = None) -> Any:
         """Parse arguments and run the appropriate command.
 
+        The whole command line, including any subgroup arguments, is
+        validated before a group function runs.
+
         Args:
             args: Arguments to parse. Defaults to sys.argv[1:].
 
@@ -468,44 +739,31 @@ class WargsGroup:
         """
         # Handle completion before full parsing
         if self._completion:
-            check_args = args if args is not None else sys.argv[1:]
-            if "--completion" in check_args:
-                idx = check_args.index("--completion")
-                if idx + 1 < len(check_args):
-                    shell = check_args[idx + 1]
-                    if shell in ("bash", "zsh", "fish"):
-                        from wArgs.completion import generate_completion
+            shell = _requested_completion_shell(args)
+            if shell is not None:
+                print(self._completion_script(shell))
+                return None
 
-                        print(generate_completion(self, shell=shell))
-                        return None
+        chain = self._parse_invocation(args)
 
-        namespace = self.parse_args(args)
+        # Run group functions outermost first (for shared setup)
+        for group, namespace in chain:
+            group._func(**group._get_group_kwargs(namespace))
 
-        # Run group function first (for shared setup)
-        group_kwargs = self._get_group_kwargs(namespace)
-        self._func(**group_kwargs)
-
-        # Get the command
+        group, namespace = chain[-1]
         command = getattr(namespace, "command", None)
         if command is None:
             # No command specified - print help
-            self.parser.print_help()
+            group._lazy_parser.print_help()
             return None
 
-        # Check for subgroup
-        if command in self._subgroups:
-            subgroup = self._subgroups[command]
-            # Parse remaining args with subgroup
-            remaining = args[args.index(command) + 1 :] if args else sys.argv[2:]
-            return subgroup.run(remaining)
-
         # Run the command
-        cmd_info = self._commands.get(command)
+        cmd_info = group._commands.get(command)
         if cmd_info is None:  # pragma: no cover
-            self.parser.error(f"Unknown command: {command}")
+            group._lazy_parser.error(f"Unknown command: {command}")
             return None
 
-        cmd_kwargs = self._get_command_kwargs(namespace, command)
+        cmd_kwargs = group._get_command_kwargs(namespace, command)
         return cmd_info.func(**cmd_kwargs)
 
     def __call__(self, *args: Any, **kwargs: Any) -> Any:
@@ -55,14 +55,17 @@ Example (class with subcommands):
 from __future__ import annotations
 
 import inspect
-from functools import wraps
+import sys
+from dataclasses import replace
+from operator import itemgetter
+from types import FunctionType
 from typing import TYPE_CHECKING, Any, Callable, overload
 
 from wArgs.builders.arguments import build_parser_config
 from wArgs.builders.parser import build_parser
 from wArgs.builders.subcommands import build_subcommand_config, extract_methods
 from wArgs.core.config import ParameterKind
-from wArgs.introspection.docstrings import parse_docstring
+from wArgs.introspection.docstrings import parse_docstring_for
 from wArgs.introspection.signatures import extract_function_info
 from wArgs.introspection.types import resolve_type
 from wArgs.utilities import debug_print
@@ -70,7 +73,208 @@ from wArgs.utilities import debug_print
 if TYPE_CHECKING:
     from argparse import ArgumentParser, Namespace
 
-    from wArgs.core.config import FunctionInfo, ParserConfig
+    from wArgs.core.config import (
+        DictExpansion,
+        FunctionInfo,
+        ParameterInfo,
+        ParserConfig,
+        TypeInfo,
+    )
+
+    # Per dict parameter: (name, default dict, ((key, expanded arg name), ...))
+    _DictPlan = tuple[tuple[str, dict[str, Any], tuple[tuple[str, str], ...]], ...]
+
+# Shells that --completion can generate scripts for
+_COMPLETION_SHELLS = frozenset(("bash", "zsh", "fish"))
+
+
+def _requested_completion_shell(args: list[str] | None) -> str | None:
+    """Find the shell requested with --completion, before full parsing.
+
+    Args:
+        args: Arguments to check. Defaults to sys.argv[1:].
+
+    Returns:
+        The shell name, or None if no supported shell was requested.
+    """
+    check_args = args if args is not None else sys.argv[1:]
+    try:
+        idx = check_args.index("--completion")
+    except ValueError:
+        return None
+    if idx + 1 < len(check_args):
+        shell = check_args[idx + 1]
+        if shell in _COMPLETION_SHELLS:
+            return shell
+    return None
+
+
+def _dict_expansion_plan(dict_expansions: dict[str, DictExpansion]) -> _DictPlan:
+    """Flatten dict expansions into a reconstruction plan.
+
+    The expanded argument names depend only on the config, so they are
+    formatted once here rather than on every namespace conversion.
+
+    Args:
+        dict_expansions: The parser config's dict expansions.
+
+    Returns:
+        Tuple of (param name, default dict, (key, arg name) pairs) entries.
+    """
+    return tuple(
+        (
+            param_name,
+            expansion.default_dict,
+            tuple((key, f"{param_name}_{key}") for key in expansion.keys),
+        )
+        for param_name, expansion in dict_expansions.items()
+    )
+
+
+def _reconstruct_dict_params(
+    plan: _DictPlan, ns: dict[str, Any], kwargs: dict[str, Any]
+) -> None:
+    """Rebuild expanded dict parameters from a namespace into kwargs.
+
+    Args:
+        plan: Reconstruction plan from _dict_expansion_plan.
+        ns: The parsed namespace's attribute dict.
+        kwargs: The kwargs dict to add the reconstructed dicts to.
+    """
+    for param_name, default_dict, keys in plan:
+        reconstructed: dict[str, Any] = dict(default_dict)
+        for key, expanded_name in keys:
+            value = ns.get(expanded_name)
+            if value is not None:
+                reconstructed[key] = value
+        kwargs[param_name] = reconstructed
+
+
+def _make_kwargs_converter(
+    params: tuple[ParameterInfo, ...], dict_plan: _DictPlan
+) -> Callable[[dict[str, Any]], dict[str, Any]]:
+    """Build a function that turns a namespace dict into function kwargs.
+
+    The parameter names and an ``itemgetter`` over them are computed once,
+    so each call is a single batched lookup rather than a walk over the
+    parameter list.
+
+    Args:
+        params: Parameters read straight from the namespace.
+        dict_plan: Reconstruction plan for dict-expanded parameters.
+
+    Returns:
+        Function mapping a namespace dict to kwargs. None values are
+        omitted for parameters that have a default.
+    """
+    names = tuple(p.name for p in params)
+    required = frozenset(p.name for p in params if not p.has_default)
+    getter = itemgetter(*names) if names else None
+    single = len(names) == 1
+
+    def convert(ns: dict[str, Any]) -> dict[str, Any]:
+        kwargs: dict[str, Any] = {}
+
+        # Reconstruct dict parameters from expanded args (usually none)
+        if dict_plan:
+            _reconstruct_dict_params(dict_plan, ns, kwargs)
+
+        if getter is None:
+            return kwargs
+        try:
+            values = getter(ns)
+        except KeyError:
+            # Some names were not parsed into the namespace
+            values = tuple(ns.get(name) for name in names)
+        else:
+            if single:
+                values = (values,)
+        for name, value in zip(names, values):
+            if value is not None or name in required:
+                kwargs[name] = value
+        return kwargs
+
+    return convert
+
+
+def _compute_parser_config(
+    func: Callable[..., Any],
+    prog: str | None,
+    description: str | None,
+    prefix: bool | str,
+    add_help: bool,
+    formatter_class: str | None,
+) -> tuple[FunctionInfo, ParserConfig]:
+    """Introspect a function and build its parser configuration.
+
+    Args:
+        func: The decorated function.
+        prog: Program name override.
+        description: Description override.
+        prefix: Argument prefixing mode (see WargsWrapper).
+        add_help: Whether to add -h/--help.
+        formatter_class: Help formatter class name.
+
+    Returns:
+        Tuple of (function info, parser configuration).
+    """
+    # Extract function info
+    func_info = extract_function_info(func)
+
+    # Parse docstring for parameter descriptions, unless no parameter
+    # could take one (the parser description uses the raw docstring)
+    needs_docs = any(param.description is None for param in func_info.parameters)
+    docstring_params = parse_docstring_for(func).params if needs_docs else {}
+
+    # Resolve types and add descriptions from docstring in one pass, into
+    # new parameters since the extracted info is shared. Annotations such
+    # as int or str repeat, so each distinct one is resolved once
+    # (TypeInfo is immutable and safe to share).
+    resolved: dict[Any, TypeInfo] = {}
+    parameters: list[ParameterInfo] = []
+    for param in func_info.parameters:
+        type_info = param.type_info
+        annotation = param.annotation
+        if annotation is not None:
+            try:
+                type_info = resolved.get(annotation)
+            except TypeError:
+                # Unhashable annotation metadata; resolve without caching
+                type_info = resolve_type(annotation)
+            else:
+                if type_info is None:
+                    type_info = resolved[annotation] = resolve_type(annotation)
+
+        # Add description from docstring if not already set
+        help_text = param.description
+        if help_text is None:
+            help_text = docstring_params.get(param.name)
+
+        parameters.append(replace(param, type_info=type_info, description=help_text))
+    func_info = replace(func_info, parameters=parameters)
+
+    # Determine prefix for arguments
+    if prefix is False:
+        # No prefix (default)
+        arg_prefix = None
+    elif prefix is True:
+        # Use function name as prefix
+        arg_prefix = func_info.name
+    else:
+        # Use custom prefix string
+        arg_prefix = str(prefix)
+
+    # Build parser config
+    parser_config = build_parser_config(
+        func_info,
+        prog=prog,
+        description=description,
+        prefix=arg_prefix,
+        add_help=add_help,
+        formatter_class=formatter_class,
+    )
+
+    return func_info, parser_config
 
 
 class WargsWrapper:
@@ -85,6 +289,27 @@ class WargsWrapper:
         description: Description override.
     """
 
+    # Marks wrapper instances for wArgs.utilities without an isinstance
+    # check; a class attribute, so functools.wraps never copies it
+    __wargs_wrapper__ = True
+
+    # Private state lives in slots; __dict__ holds the copied metadata
+    __slots__ = (
+        "__dict__",
+        "_add_help",
+        "_completion",
+        "_convert_kwargs",
+        "_description",
+        "_dict_plan",
+        "_formatter_class",
+        "_func",
+        "_func_info",
+        "_parser",
+        "_parser_config",
+        "_prefix",
+        "_prog",
+    )
+
     def __init__(
         self,
         func: Callable[..., Any],
@@ -118,9 +343,19 @@ class WargsWrapper:
         self._parser: ArgumentParser | None = None
         self._func_info: FunctionInfo | None = None
         self._parser_config: ParserConfig | None = None
-
-        # Copy function metadata
-        wraps(func)(self)
+        self._dict_plan: _DictPlan = ()
+        self._convert_kwargs: Callable[[dict[str, Any]], dict[str, Any]] | None = None
+
+        # Copy function metadata (what functools.wraps would copy, without
+        # the generic update_wrapper machinery)
+        self.__name__ = func.__name__
+        self.__qualname__ = getattr(func, "__qualname__", func.__name__)
+        self.__doc__ = func.__doc__
+        self.__module__ = func.__module__
+        self.__wrapped__ = func
+        func_dict = getattr(func, "__dict__", None)
+        if func_dict:
+            self.__dict__.update(func_dict)
 
     @property
     def func(self) -> Callable[..., Any]:
@@ -139,52 +374,40 @@ class WargsWrapper:
         """Get the parser configuration (for debugging/testing)."""
         return self._parser_config
 
-    def _build_parser(self) -> None:
-        """Build the parser from function introspection."""
-        debug_print(f"Building parser for function: {self._func.__name__}")
-
-        # Extract function info
-        func_info = extract_function_info(self._func)
-
-        # Parse docstring for parameter descriptions
-        docstring_info = parse_docstring(func_info.description)
-
-        # Resolve types and add descriptions from docstring
-        for param in func_info.parameters:
-            # Resolve type annotation
-            if param.annotation is not None:
-                param.type_info = resolve_type(param.annotation)
-
-            # Add description from docstring if not already set
-            if param.description is None and param.name in docstring_info.params:
-                param.description = docstring_info.params[param.name]
+    def _build_config(self) -> None:
+        """Build the parser configuration from function introspection."""
+        if __debug__:
+            debug_print("Building config for function:", self._func.__name__)
+
+        self._func_info, self._parser_config = _compute_parser_config(
+            self._func,
+            self._prog,
+            self._description,
+            self._prefix,
+            self._add_help,
+            self._formatter_class or None,
+        )
+        self._dict_plan = _dict_expansion_plan(self._parser_config.dict_expansions)
+
+        # Parameters read straight from the namespace: not *args/**kwargs
+        # and not reconstructed from dict expansions
+        scalar_params = tuple(
+            p
+            for p in self._func_info.parameters
+            if p.kind not in (ParameterKind.VAR_POSITIONAL, ParameterKind.VAR_KEYWORD)
+            and p.name not in self._parser_config.dict_expansions
+        )
+        self._convert_kwargs = _make_kwargs_converter(scalar_params, self._dict_plan)
 
-        # Store for later use
-        self._func_info = func_info
-
-        # Determine prefix for arguments
-        if self._prefix is False:
-            # No prefix (default)
-            arg_prefix = None
-        elif self._prefix is True:
-            # Use function name as prefix
-            arg_prefix = func_info.name
-        else:
-            # Use custom prefix string
-            arg_prefix = str(self._prefix)
+    def _build_parser(self) -> None:
+        """Build the ArgumentParser, introspecting the function if needed."""
+        if self._parser_config is None:
+            self._build_config()
 
-        # Build parser config
-        self._parser_config = build_parser_config(
-            func_info,
-            prog=self._prog,
-            description=self._description,
-            prefix=arg_prefix,
-        )
+        assert self._parser_config is not None
 
-        # Apply options
-        if self._formatter_class:
-            self._parser_config.formatter_class = self._formatter_class
-        self._parser_config.add_help = self._add_help
+        if __debug__:
+            debug_print("Building parser for function:", self._func.__name__)
 
         # Build the actual parser
         self._parser = build_parser(self._parser_config)
@@ -207,9 +430,11 @@ class WargsWrapper:
         Returns:
             Namespace with parsed arguments.
         """
-        debug_print(f"Parsing args: {args}")
+        if __debug__:
+            debug_print("Parsing args:", args)
         result = self.parser.parse_args(args)
-        debug_print(f"Parsed result: {result}")
+        if __debug__:
+            debug_print("Parsed result:", result)
         return result
 
     def _convert_namespace_to_kwargs(self, namespace: Namespace) -> dict[str, Any]:
@@ -221,39 +446,13 @@ class WargsWrapper:
         Returns:
             Dictionary of keyword arguments for the function.
         """
-        kwargs: dict[str, Any] = {}
+        convert = self._convert_kwargs
+        if convert is None:
+            self._build_config()
+            convert = self._convert_kwargs
+            assert convert is not None
 
-        if self._func_info is None:
-            self._build_parser()
-
-        assert self._func_info is not None
-        assert self._parser_config is not None
-
-        # Reconstruct dict parameters from expanded args
-        for param_name, expansion in self._parser_config.dict_expansions.items():
-            reconstructed: dict[str, Any] = dict(expansion.default_dict)
-            for key in expansion.keys:
-                expanded_name = f"{param_name}_{key}"
-                value = getattr(namespace, expanded_name, None)
-                if value is not None:
-                    reconstructed[key] = value
-            kwargs[param_name] = reconstructed
-
-        for param in self._func_info.parameters:
-            # Skip *args and **kwargs
-            if param.kind in (ParameterKind.VAR_POSITIONAL, ParameterKind.VAR_KEYWORD):
-                continue
-
-            # Skip dict-expanded parameters (already handled above)
-            if param.name in self._parser_config.dict_expansions:
-                continue
-
-            # Get value from namespace
-            value = getattr(namespace, param.name, None)
-            if value is not None or param.has_default is False:
-                kwargs[param.name] = value
-
-        return kwargs
+        return convert(vars(namespace))
 
     def run(self, args: list[str] | None = None) -> Any:
         """Parse arguments and call the function.
@@ -266,18 +465,15 @@ class WargsWrapper:
         """
         # Handle completion before full parsing (to avoid required arg errors)
         if self._completion:
-            import sys
-
-            check_args = args if args is not None else sys.argv[1:]
-            if "--completion" in check_args:
-                idx = check_args.index("--completion")
-                if idx + 1 < len(check_args):
-                    shell = check_args[idx + 1]
-                    if shell in ("bash", "zsh", "fish"):
-                        from wArgs.completion import generate_completion
+            shell = _requested_completion_shell(args)
+            if shell is not None:
+                from wArgs.completion import generate_completion
 
-                        print(generate_completion(self, shell=shell))
-                        return None
+                # Completion only needs the config, not the parser
+                if self._parser_config is None:
+                    self._build_config()
+                print(generate_completion(self, shell=shell))
+                return None
 
         namespace = self.parse_args(args)
         kwargs = self._convert_namespace_to_kwargs(namespace)
@@ -316,6 +512,9 @@ class WargsClassWrapper:
         parser: The generated ArgumentParser with subparsers.
     """
 
+    # See WargsWrapper.__wargs_wrapper__
+    __wargs_wrapper__ = True
+
     def __init__(
         self,
         cls: type,
@@ -352,6 +551,12 @@ class WargsClassWrapper:
         self._parser: ArgumentParser | None = None
         self._parser_config: ParserConfig | None = None
         self._methods: dict[str, Any] = {}
+        self._method_names: dict[str, str] = {}
+        self._method_funcs: dict[str, FunctionType] = {}
+        self._init_params: frozenset[str] = frozenset()
+        self._init_has_var_keyword = False
+        self._init_arg_names: tuple[str, ...] = ()
+        self._init_dict_plan: _DictPlan = ()
 
         # Copy class metadata
         self.__name__ = cls.__name__
@@ -375,9 +580,10 @@ class WargsClassWrapper:
         """Get the parser configuration (for debugging/testing)."""
         return self._parser_config
 
-    def _build_parser(self) -> None:
-        """Build the parser from class introspection."""
-        debug_print(f"Building parser for class: {self._cls.__name__}")
+    def _build_config(self) -> None:
+        """Build the parser configuration from class introspection."""
+        if __debug__:
+            debug_print("Building config for class:", self._cls.__name__)
 
         # Build parser config with subcommands
         parser_config = build_subcommand_config(
@@ -393,11 +599,70 @@ class WargsClassWrapper:
             parser_config.formatter_class = self._formatter_class
         parser_config.add_help = self._add_help
 
+        self._methods = extract_methods(self._cls)
+        self._method_names = {name.replace("_", "-"): name for name in self._methods}
+
+        # Plain functions can be called with the instance directly, without
+        # creating a bound method; other descriptors go through getattr
+        static_attrs = {
+            name: inspect.getattr_static(self._cls, name) for name in self._methods
+        }
+        self._method_funcs = {
+            name: attr
+            for name, attr in static_attrs.items()
+            if isinstance(attr, FunctionType)
+        }
+
+        # Record what the class's own __init__ accepts, so kwargs extraction
+        # does not re-inspect the signature on every run
+        init_method = self._cls.__dict__.get("__init__")
+        if init_method is not None:
+            sig = inspect.signature(init_method)
+            self._init_params = frozenset(sig.parameters) - {"self"}
+            self._init_has_var_keyword = any(
+                p.kind == inspect.Parameter.VAR_KEYWORD for p in sig.parameters.values()
+            )
+        else:
+            self._init_params = frozenset()
+            self._init_has_var_keyword = False
+
+        # Global options passed to __init__: accepted by it (or its
+        # **kwargs) and not one of the args a dict parameter expanded into
+        dict_plan = _dict_expansion_plan(parser_config.dict_expansions)
+        expanded_arg_names = (
+            {name for _, _, keys in dict_plan for _, name in keys}
+            if dict_plan
+            else frozenset()
+        )
+        self._init_arg_names = tuple(
+            arg.name
+            for arg in parser_config.arguments
+            if arg.name not in expanded_arg_names
+            and (arg.name in self._init_params or self._init_has_var_keyword)
+        )
+
+        # Only dict parameters that __init__ accepts are reconstructed
+        self._init_dict_plan = tuple(
+            entry
+            for entry in dict_plan
+            if entry[0] in self._init_params or self._init_has_var_keyword
+        )
+
         # Store for later use
         self._parser_config = parser_config
 
+    def _build_parser(self) -> None:
+        """Build the ArgumentParser, introspecting the class if needed."""
+        if self._parser_config is None:
+            self._build_config()
+
+        assert self._parser_config is not None
+
+        if __debug__:
+            debug_print("Building parser for class:", self._cls.__name__)
+
         # Build the actual parser
-        self._parser = build_parser(parser_config)
+        self._parser = build_parser(self._parser_config)
 
         # Add completion argument if enabled
         if self._completion:
@@ -408,9 +673,6 @@ class WargsClassWrapper:
                 help="Generate shell completion script and exit",
             )
 
-        # Cache method references
-        self._methods = extract_methods(self._cls)
-
     def parse_args(self, args: list[str] | None = None) -> Namespace:
         """Parse command-line arguments.
 
@@ -420,9 +682,11 @@ class WargsClassWrapper:
         Returns:
             Namespace with parsed arguments.
         """
-        debug_print(f"Parsing args for class: {args}")
+        if __debug__:
+            debug_print("Parsing args for class:", args)
         result = self.parser.parse_args(args)
-        debug_print(f"Parsed result: {result}")
+        if __debug__:
+            debug_print("Parsed result:", result)
         return result
 
     def _get_init_kwargs(self, namespace: Namespace) -> dict[str, Any]:
@@ -439,53 +703,23 @@ class WargsClassWrapper:
         """
         kwargs: dict[str, Any] = {}
 
+        # Builds the init names and dict plan read below
         if self._parser_config is None:
-            self._build_parser()
+            self._build_config()
 
-        assert self._parser_config is not None
+        ns = vars(namespace)
+        dict_plan = self._init_dict_plan
 
-        # Get the actual __init__ signature to know what it accepts
-        init_method = self._cls.__dict__.get("__init__")
-        if init_method is not None:
-            import inspect as insp
-
-            sig = insp.signature(init_method)
-            valid_params = set(sig.parameters.keys()) - {"self"}
-            has_var_keyword = any(
-                p.kind == insp.Parameter.VAR_KEYWORD for p in sig.parameters.values()
-            )
-        else:
-            valid_params = set()
-            has_var_keyword = False
-
-        # Reconstruct dict parameters from expanded args
-        for param_name, expansion in self._parser_config.dict_expansions.items():
-            if param_name in valid_params or has_var_keyword:
-                reconstructed: dict[str, Any] = dict(expansion.default_dict)
-                for key in expansion.keys:
-                    expanded_name = f"{param_name}_{key}"
-                    value = getattr(namespace, expanded_name, None)
-                    if value is not None:
-                        reconstructed[key] = value
-                kwargs[param_name] = reconstructed
-
-        # Build set of expanded arg names to skip
-        expanded_arg_names: set[str] = set()
-        for expansion in self._parser_config.dict_expansions.values():
-            for key in expansion.keys:
-                expanded_arg_names.add(f"{expansion.param_name}_{key}")
+        # Reconstruct dict parameters from expanded args (usually none)
+        if dict_plan:
+            _reconstruct_dict_params(dict_plan, ns, kwargs)
 
         # Get arguments that belong to __init__ (global options)
-        for arg in self._parser_config.arguments:
-            # Skip expanded dict args (already handled above)
-            if arg.name in expanded_arg_names:
-                continue
-
-            # Only include if __init__ accepts it (or has **kwargs)
-            if arg.name in valid_params or has_var_keyword:
-                value = getattr(namespace, arg.name, None)
-                if value is not None:
-                    kwargs[arg.name] = value
+        get = ns.get
+        for name in self._init_arg_names:
+            value = get(name)
+            if value is not None:
+                kwargs[name] = value
 
         return kwargs
 
@@ -503,21 +737,24 @@ class WargsClassWrapper:
         """
         kwargs: dict[str, Any] = {}
 
-        if self._parser_config is None:
-            self._build_parser()
-
-        assert self._parser_config is not None
+        parser_config = self._parser_config
+        if parser_config is None:
+            self._build_config()
+            parser_config = self._parser_config
+            assert parser_config is not None
 
         # Get subcommand config
-        subconfig = self._parser_config.subcommands.get(method_name)
+        subconfig = parser_config.subcommands.get(method_name)
         if subconfig is None:
             return kwargs
 
         # Get arguments for this subcommand
+        get = vars(namespace).get
         for arg in subconfig.arguments:
-            value = getattr(namespace, arg.name, None)
+            name = arg.name
+            value = get(name)
             if value is not None:
-                kwargs[arg.name] = value
+                kwargs[name] = value
 
         return kwargs
 
@@ -532,18 +769,15 @@ class WargsClassWrapper:
         """
         # Handle completion before full parsing (to avoid required arg errors)
         if self._completion:
-            import sys
-
-            check_args = args if args is not None else sys.argv[1:]
-            if "--completion" in check_args:
-                idx = check_args.index("--completion")
-                if idx + 1 < len(check_args):
-                    shell = check_args[idx + 1]
-                    if shell in ("bash", "zsh", "fish"):
-                        from wArgs.completion import generate_completion
+            shell = _requested_completion_shell(args)
+            if shell is not None:
+                from wArgs.completion import generate_completion
 
-                        print(generate_completion(self, shell=shell))
-                        return None
+                # Completion only needs the config, not the parser
+                if self._parser_config is None:
+                    self._build_config()
+                print(generate_completion(self, shell=shell))
+                return None
 
         namespace = self.parse_args(args)
 
@@ -561,10 +795,13 @@ class WargsClassWrapper:
         # Get method kwargs
         method_kwargs = self._get_method_kwargs(namespace, command)
 
-        # Convert hyphenated command to Python method name
-        method_name = command.replace("-", "_")
+        # Map the hyphenated command back to its Python method name
+        method_name = self._method_names.get(command) or command.replace("-", "_")
 
         # Call the method
+        func = self._method_funcs.get(method_name)
+        if func is not None and type(instance) is self._cls:
+            return func(instance, **method_kwargs)
         method = getattr(instance, method_name)
         return method(**method_kwargs)
 
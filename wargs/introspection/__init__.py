@@ -1,22 +1,56 @@
 """Introspection engine for wArgs.
 
 This module extracts metadata from functions and classes for CLI generation.
+
+Public names are re-exported lazily (PEP 562), so importing one
+submodule does not also import the docstring, MRO, signature and type
+machinery until it is used.
 """
 
-from wArgs.introspection.docstrings import (
-    DocstringFormat,
-    DocstringInfo,
-    detect_docstring_format,
-    parse_docstring,
-)
-from wArgs.introspection.mro import (
-    get_inherited_function_info,
-    get_init_parameters,
-    merge_parameters,
-    traverse_mro,
-)
-from wArgs.introspection.signatures import extract_function_info, extract_parameters
-from wArgs.introspection.types import resolve_type
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from wArgs._lazy import _lazy_exports
+
+if TYPE_CHECKING:
+    from wArgs.introspection.docstrings import (
+        DocstringFormat,
+        DocstringInfo,
+        detect_docstring_format,
+        parse_docstring,
+        parse_docstring_for,
+    )
+    from wArgs.introspection.mro import (
+        get_inherited_function_info,
+        get_init_parameters,
+        merge_parameters,
+        traverse_mro,
+    )
+    from wArgs.introspection.signatures import (
+        extract_function_info,
+        extract_parameters,
+    )
+    from wArgs.introspection.types import resolve_type
+
+# Maps each re-exported name to the submodule that defines it
+_LAZY = {
+    "DocstringFormat": ".docstrings",
+    "DocstringInfo": ".docstrings",
+    "detect_docstring_format": ".docstrings",
+    "parse_docstring": ".docstrings",
+    "parse_docstring_for": ".docstrings",
+    "get_inherited_function_info": ".mro",
+    "get_init_parameters": ".mro",
+    "merge_parameters": ".mro",
+    "traverse_mro": ".mro",
+    "extract_function_info": ".signatures",
+    "extract_parameters": ".signatures",
+    "resolve_type": ".types",
+}
+
+
+__getattr__, __dir__ = _lazy_exports(globals(), _LAZY)
 
 __all__ = [
     "DocstringFormat",
@@ -28,6 +62,7 @@ __all__ = [
     "get_init_parameters",
     "merge_parameters",
     "parse_docstring",
+    "parse_docstring_for",
     "resolve_type",
     "traverse_mro",
 ]
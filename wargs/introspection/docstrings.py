@@ -6,9 +6,15 @@ Auto-detects the format and extracts parameter descriptions.
 
 from __future__ import annotations
 
+import inspect
 import re
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from enum import Enum, auto
+from functools import lru_cache
+from typing import Any, Callable
+from weakref import WeakKeyDictionary
+
+from wArgs.core.config import _DATACLASS_SLOTS
 
 
 class DocstringFormat(Enum):
@@ -20,7 +26,7 @@ class DocstringFormat(Enum):
     SPHINX = auto()
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class DocstringInfo:
     """Parsed docstring information.
 
@@ -41,23 +47,71 @@ class DocstringInfo:
     format: DocstringFormat = DocstringFormat.UNKNOWN
 
 
-# Patterns for format detection
-_GOOGLE_ARGS_PATTERN = re.compile(r"^\s*Args?:\s*$", re.MULTILINE)
-_GOOGLE_RETURNS_PATTERN = re.compile(r"^\s*Returns?:\s*$", re.MULTILINE)
-_GOOGLE_RAISES_PATTERN = re.compile(r"^\s*Raises?:\s*$", re.MULTILINE)
-
-_NUMPY_PARAMS_PATTERN = re.compile(r"^\s*Parameters\s*$", re.MULTILINE)
-_NUMPY_DASHES_PATTERN = re.compile(r"^\s*-{3,}\s*$", re.MULTILINE)
-
-_SPHINX_PARAM_PATTERN = re.compile(r"^\s*:param\s+\w+:", re.MULTILINE)
-_SPHINX_TYPE_PATTERN = re.compile(r"^\s*:type\s+\w+:", re.MULTILINE)
-_SPHINX_RETURNS_PATTERN = re.compile(r"^\s*:returns?:", re.MULTILINE)
-_SPHINX_RAISES_PATTERN = re.compile(r"^\s*:raises?\s+\w+:", re.MULTILINE)
-
-
+# Section markers for format detection, matched in a single scan. Each
+# group names the family a marker belongs to.
+_FORMAT_MARKERS_PATTERN = re.compile(
+    r"^\s*(?:"
+    r"(?P<sphinx>:(?:param\s+\w+|type\s+\w+|returns?|raises?\s+\w+):)"
+    r"|(?P<numpy_params>Parameters\s*$)"
+    r"|(?P<numpy_dashes>-{3,}\s*$)"
+    r"|(?P<google>(?:Args?|Returns?|Raises?):\s*$)"
+    r")",
+    re.MULTILINE,
+)
+
+# Literals every Sphinx or Google marker contains; NumPy needs "---"
+_COLON_MARKER_LITERALS = (
+    ":param",
+    ":type",
+    ":return",
+    ":raise",
+    "Arg",
+    "Return",
+    "Raise",
+)
+
+# Google-style section headers, one named group per section. [^\S\n]
+# is whitespace within a line, so a match never spans lines.
+_GOOGLE_SECTION_PATTERN = re.compile(
+    r"^[^\S\n]*(?:"
+    r"(?P<args>Args?)"
+    r"|(?P<returns>Returns?)"
+    r"|(?P<raises>Raises?)"
+    r"|(?P<yields>Yields?)"
+    r"|(?P<examples>Examples?)"
+    r"|(?P<attributes>Attributes?)"
+    r"|(?P<note>Notes?)"
+    r"):[^\S\n]*$",
+    re.MULTILINE,
+)
+
+# Google entry: "name: description" or "name (type): description", with
+# any amount of leading whitespace
+_GOOGLE_PARAM_PATTERN = re.compile(r"^(\s*)(\w+)(?:\s*\([^)]+\))?\s*:\s*(.*)$")
+
+# NumPy section underline and entry ("name : type" or just "name")
+_NUMPY_UNDERLINE_PATTERN = re.compile(r"^-{3,}$")
+_NUMPY_PARAM_PATTERN = re.compile(r"^(\w+)\s*(?::\s*.*)?$")
+
+# Sphinx field directives, matched in a single scan. The directive is
+# inside a lookahead so a description that swallows a later directive
+# does not hide it, matching separate scans per directive kind.
+_SPHINX_DIRECTIVE_PATTERN = re.compile(
+    r":(?=(?:"
+    r"param\s+(?P<param>\w+)"
+    r"|(?P<returns>returns?)"
+    r"|raises?\s+(?P<raises>\w+)"
+    r"):\s*(?P<desc>.+))"
+)
+
+
+@lru_cache(maxsize=1024)
 def detect_docstring_format(docstring: str | None) -> DocstringFormat:
     """Detect the format of a docstring.
 
+    Sphinx markers take precedence, then NumPy (a Parameters header plus a
+    dashed underline), then Google. Results are cached by docstring text.
+
     Args:
         docstring: The docstring to analyze.
 
@@ -67,33 +121,53 @@ def detect_docstring_format(docstring: str | None) -> DocstringFormat:
     if not docstring:
         return DocstringFormat.UNKNOWN
 
-    # Check for Sphinx-style first (most specific)
-    if (
-        _SPHINX_PARAM_PATTERN.search(docstring)
-        or _SPHINX_TYPE_PATTERN.search(docstring)
-        or _SPHINX_RETURNS_PATTERN.search(docstring)
-        or _SPHINX_RAISES_PATTERN.search(docstring)
+    # Sphinx and Google markers need a colon and one of the marker
+    # literals, and NumPy needs an underline; docstrings with none of them
+    # are rejected with substring checks instead of the regex
+    if "---" not in docstring and (
+        ":" not in docstring
+        or not any(literal in docstring for literal in _COLON_MARKER_LITERALS)
     ):
-        return DocstringFormat.SPHINX
+        return DocstringFormat.UNKNOWN
 
-    # Check for NumPy-style (has Parameters with dashes)
-    if _NUMPY_PARAMS_PATTERN.search(docstring) and _NUMPY_DASHES_PATTERN.search(
-        docstring
-    ):
-        return DocstringFormat.NUMPY
+    seen: set[str | None] = set()
+    for match in _FORMAT_MARKERS_PATTERN.finditer(docstring):
+        if match.lastgroup == "sphinx":
+            # Most specific, so no need to scan further
+            return DocstringFormat.SPHINX
+        seen.add(match.lastgroup)
 
-    # Check for Google-style
-    if (
-        _GOOGLE_ARGS_PATTERN.search(docstring)
-        or _GOOGLE_RETURNS_PATTERN.search(docstring)
-        or _GOOGLE_RAISES_PATTERN.search(docstring)
-    ):
+    if "numpy_params" in seen and "numpy_dashes" in seen:
+        return DocstringFormat.NUMPY
+    if "google" in seen:
         return DocstringFormat.GOOGLE
-
     return DocstringFormat.UNKNOWN
 
 
-def _parse_google_docstring(docstring: str) -> DocstringInfo:
+def _split_and_summarize(docstring: str) -> tuple[str | None, list[str]]:
+    """Split a docstring into lines and find its first non-empty line.
+
+    Args:
+        docstring: The docstring to split.
+
+    Returns:
+        Tuple of (summary, lines), where summary is the stripped first
+        non-empty line or None.
+    """
+    return _extract_summary(docstring), docstring.split("\n")
+
+
+def _extract_summary(docstring: str) -> str | None:
+    """Return the stripped first non-empty line of a docstring, or None."""
+    text = docstring.lstrip()
+    if not text:
+        return None
+    return text.split("\n", 1)[0].strip()
+
+
+def _parse_google_docstring(
+    docstring: str, lines: list[str], summary: str | None
+) -> DocstringInfo:
     """Parse a Google-style docstring.
 
     Google style example:
@@ -113,39 +187,24 @@ def _parse_google_docstring(docstring: str) -> DocstringInfo:
             ValueError: When something is wrong.
         '''
     """
-    info = DocstringInfo(format=DocstringFormat.GOOGLE)
-    lines = docstring.split("\n")
-
-    # Extract summary (first non-empty line)
-    for line in lines:
-        stripped = line.strip()
-        if stripped:
-            info.summary = stripped
-            break
+    info = DocstringInfo(format=DocstringFormat.GOOGLE, summary=summary)
 
     # Find section boundaries
     sections: dict[str, tuple[int, int]] = {}
     current_section = "description"
     section_start = 0
 
-    section_headers = {
-        "args": re.compile(r"^\s*Args?:\s*$"),
-        "returns": re.compile(r"^\s*Returns?:\s*$"),
-        "raises": re.compile(r"^\s*Raises?:\s*$"),
-        "yields": re.compile(r"^\s*Yields?:\s*$"),
-        "examples": re.compile(r"^\s*Examples?:\s*$"),
-        "attributes": re.compile(r"^\s*Attributes?:\s*$"),
-        "note": re.compile(r"^\s*Notes?:\s*$"),
-    }
-
-    for i, line in enumerate(lines):
-        for section_name, pattern in section_headers.items():
-            if pattern.match(line):
-                if current_section:
-                    sections[current_section] = (section_start, i)
-                current_section = section_name
-                section_start = i + 1
-                break
+    # One scan over the whole docstring; line numbers are tracked by
+    # counting newlines between consecutive headers
+    line_no = 0
+    pos = 0
+    for match in _GOOGLE_SECTION_PATTERN.finditer(docstring):
+        line_no += docstring.count("\n", pos, match.start())
+        pos = match.start()
+        if current_section:
+            sections[current_section] = (section_start, line_no)
+        current_section = match.lastgroup or ""
+        section_start = line_no + 1
 
     # Close the last section
     if current_section:
@@ -187,21 +246,25 @@ def _parse_google_params(lines: list[str]) -> dict[str, str]:
     """
     params: dict[str, str] = {}
     current_param: str | None = None
+    # Entries are stripped and non-empty, so joining them needs no strip
     current_desc: list[str] = []
     base_indent: int | None = None
 
-    # Pattern for "name: description" or "name (type): description"
-    # Allow any amount of leading whitespace
-    param_pattern = re.compile(r"^(\s*)(\w+)(?:\s*\([^)]+\))?\s*:\s*(.*)$")
-
     for line in lines:
-        if not line.strip():
+        body = line.lstrip()
+        if not body:
             continue
+        stripped = body.rstrip()
 
-        param_match = param_pattern.match(line)
-        if param_match:
-            indent = len(param_match.group(1))
+        # Lines indented past the entries are continuations, so only the
+        # remaining lines need the entry regex
+        indent = len(line) - len(body)
+        if base_indent is not None and indent > base_indent:
+            current_desc.append(stripped)
+            continue
 
+        param_match = _GOOGLE_PARAM_PATTERN.match(line)
+        if param_match:
             # First param defines the base indentation
             if base_indent is None:
                 base_indent = indent
@@ -210,27 +273,20 @@ def _parse_google_params(lines: list[str]) -> dict[str, str]:
             if indent == base_indent:
                 # Save previous parameter
                 if current_param is not None:
-                    params[current_param] = " ".join(current_desc).strip()
+                    params[current_param] = " ".join(current_desc)
 
                 current_param = param_match.group(2)
                 desc = param_match.group(3).strip()
                 current_desc = [desc] if desc else []
-                continue
-
-        # Check for continuation (more indented than base)
-        if current_param is not None and base_indent is not None:
-            line_indent = len(line) - len(line.lstrip())
-            if line_indent > base_indent:
-                current_desc.append(line.strip())
 
     # Save last parameter
     if current_param is not None:
-        params[current_param] = " ".join(current_desc).strip()
+        params[current_param] = " ".join(current_desc)
 
     return params
 
 
-def _parse_numpy_docstring(docstring: str) -> DocstringInfo:
+def _parse_numpy_docstring(lines: list[str], summary: str | None) -> DocstringInfo:
     """Parse a NumPy-style docstring.
 
     NumPy style example:
@@ -251,15 +307,7 @@ def _parse_numpy_docstring(docstring: str) -> DocstringInfo:
             Description of return value.
         '''
     """
-    info = DocstringInfo(format=DocstringFormat.NUMPY)
-    lines = docstring.split("\n")
-
-    # Extract summary
-    for line in lines:
-        stripped = line.strip()
-        if stripped:
-            info.summary = stripped
-            break
+    info = DocstringInfo(format=DocstringFormat.NUMPY, summary=summary)
 
     # Find sections (marked by underlines)
     sections: dict[str, tuple[int, int]] = {}
@@ -271,7 +319,7 @@ def _parse_numpy_docstring(docstring: str) -> DocstringInfo:
         line = lines[i].strip()
 
         # Check if next line is a dashes line (section header)
-        if i + 1 < len(lines) and re.match(r"^-{3,}$", lines[i + 1].strip()):
+        if i + 1 < len(lines) and _NUMPY_UNDERLINE_PATTERN.match(lines[i + 1].strip()):
             # This line is a section header
             if current_section:
                 sections[current_section] = (section_start, i)
@@ -320,18 +368,16 @@ def _parse_numpy_params(lines: list[str]) -> dict[str, str]:
     """
     params: dict[str, str] = {}
     current_param: str | None = None
+    # Entries are stripped and non-empty, so joining them needs no strip
     current_desc: list[str] = []
     base_indent: int | None = None
 
-    # Pattern for "name : type" or just "name"
-    param_pattern = re.compile(r"^(\w+)\s*(?::\s*.*)?$")
-
     for line in lines:
-        stripped = line.strip()
-        indent = len(line) - len(line.lstrip())
-
-        if not stripped:
+        body = line.lstrip()
+        if not body:
             continue
+        stripped = body.rstrip()
+        indent = len(line) - len(body)
 
         # Detect base indentation from first non-empty line
         if base_indent is None:
@@ -339,11 +385,11 @@ def _parse_numpy_params(lines: list[str]) -> dict[str, str]:
 
         # Check if this is a parameter line (at base indent level)
         if indent == base_indent:
-            param_match = param_pattern.match(stripped)
+            param_match = _NUMPY_PARAM_PATTERN.match(stripped)
             if param_match:
                 # Save previous parameter
                 if current_param is not None:
-                    params[current_param] = " ".join(current_desc).strip()
+                    params[current_param] = " ".join(current_desc)
 
                 current_param = param_match.group(1)
                 current_desc = []
@@ -353,12 +399,14 @@ def _parse_numpy_params(lines: list[str]) -> dict[str, str]:
 
     # Save last parameter
     if current_param is not None:
-        params[current_param] = " ".join(current_desc).strip()
+        params[current_param] = " ".join(current_desc)
 
     return params
 
 
-def _parse_sphinx_docstring(docstring: str) -> DocstringInfo:
+def _parse_sphinx_docstring(
+    docstring: str, lines: list[str], summary: str | None
+) -> DocstringInfo:
     """Parse a Sphinx-style docstring.
 
     Sphinx style example:
@@ -373,15 +421,16 @@ def _parse_sphinx_docstring(docstring: str) -> DocstringInfo:
         :raises ValueError: When something is wrong.
         '''
     """
-    info = DocstringInfo(format=DocstringFormat.SPHINX)
-    lines = docstring.split("\n")
+    info = DocstringInfo(format=DocstringFormat.SPHINX, summary=summary)
 
-    # Extract summary
-    for line in lines:
-        stripped = line.strip()
-        if stripped and not stripped.startswith(":"):
-            info.summary = stripped
-            break
+    # The summary skips leading directive lines
+    if summary is not None and summary.startswith(":"):
+        info.summary = None
+        for line in lines:
+            stripped = line.strip()
+            if stripped and not stripped.startswith(":"):
+                info.summary = stripped
+                break
 
     # Extract description (everything before first :param, :returns, etc.)
     desc_lines: list[str] = []
@@ -395,38 +444,57 @@ def _parse_sphinx_docstring(docstring: str) -> DocstringInfo:
     if desc_text:
         info.description = desc_text
 
-    # Parse :param directives
-    param_pattern = re.compile(r":param\s+(\w+):\s*(.+)")
-    returns_pattern = re.compile(r":returns?:\s*(.+)")
-    raises_pattern = re.compile(r":raises?\s+(\w+):\s*(.+)")
+    # Parse :param, :returns and :raises directives. Entries of one kind
+    # never overlap, so a directive inside an earlier description of the
+    # same kind is skipped; only the first :returns is used.
+    param_end = raises_end = 0
+    for match in _SPHINX_DIRECTIVE_PATTERN.finditer(docstring):
+        start = match.start()
+        param_name = match.group("param")
+        if param_name is not None:
+            if start >= param_end:
+                info.params[param_name] = match.group("desc").strip()
+                param_end = match.end("desc")
+        elif match.group("returns") is not None:
+            if info.returns is None:
+                info.returns = match.group("desc").strip()
+        elif start >= raises_end:
+            info.raises[match.group("raises")] = match.group("desc").strip()
+            raises_end = match.end("desc")
 
-    full_text = docstring
+    return info
 
-    # Find all :param entries
-    for match in param_pattern.finditer(full_text):
-        param_name = match.group(1)
-        description = match.group(2).strip()
-        info.params[param_name] = description
 
-    # Find :returns
-    returns_match = returns_pattern.search(full_text)
-    if returns_match:
-        info.returns = returns_match.group(1).strip()
+@lru_cache(maxsize=1024)
+def _parse_docstring_cached(docstring: str) -> DocstringInfo:
+    """Parse a non-empty docstring, caching the result by its text.
 
-    # Find :raises entries
-    for match in raises_pattern.finditer(full_text):
-        exc_name = match.group(1)
-        description = match.group(2).strip()
-        info.raises[exc_name] = description
+    The returned object is shared between callers; parse_docstring hands
+    out copies of it.
+    """
+    format_type = detect_docstring_format(docstring)
+    summary, lines = _split_and_summarize(docstring)
 
-    return info
+    if format_type == DocstringFormat.GOOGLE:
+        return _parse_google_docstring(docstring, lines, summary)
+    elif format_type == DocstringFormat.NUMPY:
+        return _parse_numpy_docstring(lines, summary)
+    elif format_type == DocstringFormat.SPHINX:
+        return _parse_sphinx_docstring(docstring, lines, summary)
+    else:
+        # For unknown format, just extract summary
+        info = DocstringInfo(format=DocstringFormat.UNKNOWN, summary=summary)
+        if summary is not None:
+            info.description = docstring.strip()
+        return info
 
 
 def parse_docstring(docstring: str | None) -> DocstringInfo:
     """Parse a docstring and extract structured information.
 
     Auto-detects the docstring format and delegates to the appropriate
-    parser.
+    parser. Results are cached by docstring text, so the same docstring
+    (e.g. an __init__ seen again during MRO traversal) is parsed once.
 
     Args:
         docstring: The docstring to parse.
@@ -437,25 +505,44 @@ def parse_docstring(docstring: str | None) -> DocstringInfo:
     if not docstring:
         return DocstringInfo()
 
-    format_type = detect_docstring_format(docstring)
+    info = _parse_docstring_cached(docstring)
+    # Callers may modify the result, so each gets its own dicts
+    return replace(info, params=dict(info.params), raises=dict(info.raises))
 
-    if format_type == DocstringFormat.GOOGLE:
-        return _parse_google_docstring(docstring)
-    elif format_type == DocstringFormat.NUMPY:
-        return _parse_numpy_docstring(docstring)
-    elif format_type == DocstringFormat.SPHINX:
-        return _parse_sphinx_docstring(docstring)
-    else:
-        # For unknown format, just extract summary
-        info = DocstringInfo(format=DocstringFormat.UNKNOWN)
-        lines = docstring.split("\n")
-        for line in lines:
-            stripped = line.strip()
-            if stripped:
-                info.summary = stripped
-                info.description = docstring.strip()
-                break
-        return info
+
+# Parsed docstrings per function, with the raw __doc__ they were parsed from
+_PARSED_CACHE: WeakKeyDictionary[
+    Callable[..., Any], tuple[str | None, DocstringInfo]
+] = WeakKeyDictionary()
+
+
+def parse_docstring_for(func: Callable[..., Any]) -> DocstringInfo:
+    """Parse a function's docstring, reusing the result for that function.
+
+    The result is cached weakly on the function object, so wrapping the
+    same function several times parses its docstring once. The cached
+    entry is discarded if the function's ``__doc__`` has changed.
+
+    Args:
+        func: The function whose docstring to parse.
+
+    Returns:
+        DocstringInfo for the function's cleaned docstring. Callers must
+        treat it as read-only.
+    """
+    doc = getattr(func, "__doc__", None)
+    try:
+        cached = _PARSED_CACHE.get(func)
+    except TypeError:
+        # Not weak-referenceable; parse without caching
+        return parse_docstring(inspect.getdoc(func))
+
+    if cached is not None and cached[0] == doc:
+        return cached[1]
+
+    info = parse_docstring(inspect.getdoc(func))
+    _PARSED_CACHE[func] = (doc, info)
+    return info
 
 
 __all__ = [
@@ -463,4 +550,5 @@ __all__ = [
     "DocstringInfo",
     "detect_docstring_format",
     "parse_docstring",
+    "parse_docstring_for",
 ]
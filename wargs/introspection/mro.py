@@ -6,13 +6,21 @@ them with child class parameters.
 
 from __future__ import annotations
 
+import inspect
 import warnings
+from dataclasses import replace
+from weakref import WeakKeyDictionary
 
 from wArgs.core.config import FunctionInfo, ParameterInfo
 from wArgs.introspection.docstrings import parse_docstring
 from wArgs.introspection.signatures import extract_function_info
 from wArgs.introspection.types import resolve_type
 
+# Inherited FunctionInfo per class, keyed further by warn_on_conflict
+_INHERITED_INFO_CACHE: WeakKeyDictionary[type, dict[bool, FunctionInfo]] = (
+    WeakKeyDictionary()
+)
+
 
 def get_init_parameters(cls: type) -> list[ParameterInfo]:
     """Extract __init__ parameters from a single class.
@@ -30,17 +38,25 @@ def get_init_parameters(cls: type) -> list[ParameterInfo]:
     # Extract function info
     func_info = extract_function_info(init_method)
 
-    # Parse docstring for descriptions
-    docstring_info = parse_docstring(func_info.description)
+    # Parse docstring for descriptions; __init__ often has none
+    if func_info.description:
+        doc_params = parse_docstring(func_info.description).params
+    else:
+        doc_params = {}
 
-    # Resolve types and add descriptions
+    # Resolve types and add descriptions; the extracted parameters are
+    # shared, so resolved copies are returned
+    parameters = []
     for param in func_info.parameters:
+        type_info = param.type_info
         if param.annotation is not None:
-            param.type_info = resolve_type(param.annotation)
-        if param.description is None and param.name in docstring_info.params:
-            param.description = docstring_info.params[param.name]
+            type_info = resolve_type(param.annotation)
+        description = param.description
+        if doc_params and description is None:
+            description = doc_params.get(param.name)
+        parameters.append(replace(param, type_info=type_info, description=description))
 
-    return func_info.parameters
+    return parameters
 
 
 def _check_type_conflict(
@@ -100,34 +116,18 @@ def merge_parameters(
     Returns:
         Merged list of parameters (child overrides parent).
     """
-    # Build lookup of child params by name
-    child_by_name = {p.name: p for p in child_params}
-
-    merged: list[ParameterInfo] = []
-    seen_names: set[str] = set()
-
-    # First, add all child parameters
-    for param in child_params:
-        merged.append(param)
-        seen_names.add(param.name)
+    # Keyed by name; dicts keep insertion order, so children come first
+    merged = {p.name: p for p in child_params}
 
     # Then, add parent parameters that aren't overridden
     for param in parent_params:
-        if param.name in seen_names:
-            # Check for type conflict
-            if warn_on_conflict and param.name in child_by_name:
-                _check_type_conflict(
-                    child_by_name[param.name],
-                    param,
-                    child_cls,
-                    parent_cls,
-                )
-            continue
+        child = merged.get(param.name)
+        if child is None:
+            merged[param.name] = param
+        elif warn_on_conflict:
+            _check_type_conflict(child, param, child_cls, parent_cls)
 
-        merged.append(param)
-        seen_names.add(param.name)
-
-    return merged
+    return list(merged.values())
 
 
 def traverse_mro(
@@ -155,14 +155,9 @@ def traverse_mro(
 
     # Start with the most derived class (first in MRO)
     result = get_init_parameters(mro[0])
-    seen_classes = {mro[0]}
 
-    # Merge in parameters from parent classes
+    # Merge in parameters from parent classes (__mro__ has no duplicates)
     for parent_cls in mro[1:]:
-        if parent_cls in seen_classes:
-            continue
-        seen_classes.add(parent_cls)
-
         parent_params = get_init_parameters(parent_cls)
         if parent_params:
             result = merge_parameters(
@@ -183,6 +178,9 @@ def get_inherited_function_info(
 ) -> FunctionInfo:
     """Get FunctionInfo with inherited parameters from MRO.
 
+    The result is cached per class, so the MRO is traversed (and any
+    conflict warnings emitted) once; callers must treat it as read-only.
+
     Args:
         cls: The class to get info for.
         warn_on_conflict: Whether to warn on type conflicts.
@@ -190,11 +188,27 @@ def get_inherited_function_info(
     Returns:
         FunctionInfo with merged parameters from class hierarchy.
     """
+    try:
+        by_warn = _INHERITED_INFO_CACHE.get(cls)
+    except TypeError:
+        # Not weak-referenceable; build without caching
+        return _build_inherited_function_info(cls, warn_on_conflict)
+    if by_warn is None:
+        by_warn = _INHERITED_INFO_CACHE[cls] = {}
+
+    info = by_warn.get(warn_on_conflict)
+    if info is None:
+        info = by_warn[warn_on_conflict] = _build_inherited_function_info(
+            cls, warn_on_conflict
+        )
+    return info
+
+
+def _build_inherited_function_info(cls: type, warn_on_conflict: bool) -> FunctionInfo:
+    """Traverse the MRO and build the inherited FunctionInfo for a class."""
     parameters = traverse_mro(cls, warn_on_conflict=warn_on_conflict)
 
     # Get class docstring
-    import inspect
-
     doc = inspect.getdoc(cls)
 
     return FunctionInfo(
@@ -7,7 +7,10 @@ inspect module.
 from __future__ import annotations
 
 import inspect
-from typing import Any, Callable, get_type_hints
+from inspect import CO_VARARGS, CO_VARKEYWORDS
+from types import FunctionType
+from typing import Any, Callable, Iterator, Tuple, get_type_hints
+from weakref import WeakKeyDictionary
 
 from wArgs.core.config import (
     MISSING,
@@ -17,17 +20,110 @@ from wArgs.core.config import (
 )
 from wArgs.core.exceptions import IntrospectionError
 
+# FunctionInfo per function object, with the attributes it was read from
+# (see _info_sources). Only results whose type hints resolved are cached,
+# so forward references that fail early are retried.
+_FUNCTION_INFO_CACHE: WeakKeyDictionary[
+    Callable[..., Any], tuple[tuple[Any, ...], FunctionInfo]
+] = WeakKeyDictionary()
 
-def _convert_parameter_kind(kind: inspect._ParameterKind) -> ParameterKind:
+# (name, raw annotation, raw default, kind); a missing annotation or
+# default is inspect.Parameter.empty, as in a Signature
+_RawParameter = Tuple[str, Any, Any, ParameterKind]
+
+
+def _convert_parameter_kind(kind: int) -> ParameterKind:
     """Convert inspect.Parameter kind to ParameterKind enum."""
-    mapping = {
-        inspect.Parameter.POSITIONAL_ONLY: ParameterKind.POSITIONAL_ONLY,
-        inspect.Parameter.POSITIONAL_OR_KEYWORD: ParameterKind.POSITIONAL_OR_KEYWORD,
-        inspect.Parameter.VAR_POSITIONAL: ParameterKind.VAR_POSITIONAL,
-        inspect.Parameter.KEYWORD_ONLY: ParameterKind.KEYWORD_ONLY,
-        inspect.Parameter.VAR_KEYWORD: ParameterKind.VAR_KEYWORD,
-    }
-    return mapping[kind]
+    return ParameterKind(kind)
+
+
+def _info_sources(func: Callable[..., Any]) -> tuple[Any, ...]:
+    """Get the reassignable attributes a function's FunctionInfo is read from.
+
+    A cached FunctionInfo is only reused while each of these is the same
+    object, so assigning a new docstring or defaults is picked up.
+    """
+    return (
+        getattr(func, "__doc__", None),
+        getattr(func, "__defaults__", None),
+        getattr(func, "__kwdefaults__", None),
+        getattr(func, "__annotations__", None),
+    )
+
+
+def _get_hints(func: Callable[..., Any]) -> tuple[dict[str, Any], bool]:
+    """Get a function's type hints.
+
+    Uses include_extras=True to preserve Annotated metadata.
+
+    Args:
+        func: The function to get hints for.
+
+    Returns:
+        Tuple of (hints, resolved). If get_type_hints fails, the raw
+        __annotations__ are returned with resolved set to False.
+    """
+    try:
+        return get_type_hints(func, include_extras=True), True
+    except Exception:
+        # Fall back to annotations if get_type_hints fails
+        return getattr(func, "__annotations__", {}), False
+
+
+def _code_parameters(func: Callable[..., Any]) -> list[_RawParameter] | None:
+    """Read a plain function's parameters from its code object.
+
+    Only functions whose parameters are all positional are handled, which
+    covers most __init__ methods without building a Signature.
+
+    Args:
+        func: The function to read.
+
+    Returns:
+        The raw parameters, or None if inspect.signature is needed.
+    """
+    if type(func) is not FunctionType:
+        return None
+    # inspect.signature honours these, so leave such functions to it
+    if "__wrapped__" in func.__dict__ or "__signature__" in func.__dict__:
+        return None
+    code = func.__code__
+    if code.co_flags & (CO_VARARGS | CO_VARKEYWORDS) or code.co_kwonlyargcount:
+        return None
+
+    argcount = code.co_argcount
+    posonlycount = getattr(code, "co_posonlyargcount", 0)
+    defaults = func.__defaults__ or ()
+    first_default = argcount - len(defaults)
+    annotations = func.__annotations__
+    empty = inspect.Parameter.empty
+
+    parameters: list[_RawParameter] = []
+    for index, name in enumerate(code.co_varnames[:argcount]):
+        default = defaults[index - first_default] if index >= first_default else empty
+        kind = (
+            ParameterKind.POSITIONAL_ONLY
+            if index < posonlycount
+            else ParameterKind.POSITIONAL_OR_KEYWORD
+        )
+        parameters.append((name, annotations.get(name, empty), default, kind))
+    return parameters
+
+
+def _signature_parameters(func: Callable[..., Any]) -> Iterator[_RawParameter]:
+    """Read any callable's parameters through inspect.signature.
+
+    Raises:
+        IntrospectionError: If the callable has no signature.
+    """
+    try:
+        sig = inspect.signature(func)
+    except (ValueError, TypeError) as e:
+        raise IntrospectionError(f"Cannot get signature for {func!r}: {e}") from e
+
+    for name, param in sig.parameters.items():
+        kind = _convert_parameter_kind(param.kind)
+        yield name, param.annotation, param.default, kind
 
 
 def extract_parameters(
@@ -47,34 +143,37 @@ def extract_parameters(
     Raises:
         IntrospectionError: If the function cannot be introspected.
     """
-    try:
-        sig = inspect.signature(func)
-    except (ValueError, TypeError) as e:
-        raise IntrospectionError(f"Cannot get signature for {func!r}: {e}") from e
-
     # Get type hints, handling forward references
-    # Use include_extras=True to preserve Annotated metadata
-    try:
-        hints = get_type_hints(func, include_extras=True)
-    except Exception:
-        # Fall back to annotations if get_type_hints fails
-        hints = getattr(func, "__annotations__", {})
+    hints, _ = _get_hints(func)
+    return _build_parameters(func, hints, include_self=include_self)
+
+
+def _build_parameters(
+    func: Callable[..., Any],
+    hints: dict[str, Any],
+    *,
+    include_self: bool,
+) -> list[ParameterInfo]:
+    """Build ParameterInfo objects from a function's signature and hints."""
+    raw_parameters = _code_parameters(func)
+    if raw_parameters is None:
+        raw_parameters = list(_signature_parameters(func))
 
     parameters: list[ParameterInfo] = []
 
-    for name, param in sig.parameters.items():
+    for name, raw_annotation, raw_default, kind in raw_parameters:
         # Skip self/cls unless explicitly requested
         if not include_self and name in ("self", "cls"):
             continue
 
         # Get annotation from type hints (resolved) or signature
-        annotation = hints.get(name, param.annotation)
+        annotation = hints.get(name, raw_annotation)
         if annotation is inspect.Parameter.empty:
             annotation = None
 
         # Determine if there's a default value
-        has_default = param.default is not inspect.Parameter.empty
-        default = param.default if has_default else MISSING
+        has_default = raw_default is not inspect.Parameter.empty
+        default = raw_default if has_default else MISSING
 
         parameters.append(
             ParameterInfo(
@@ -82,7 +181,7 @@ def extract_parameters(
                 annotation=annotation,
                 default=default,
                 has_default=has_default,
-                kind=_convert_parameter_kind(param.kind),
+                kind=kind,
             )
         )
 
@@ -93,6 +192,9 @@ def extract_function_info(func: Callable[..., Any]) -> FunctionInfo:
     """Extract complete function information.
 
     Combines signature analysis with source location information.
+    Results are cached per function object and shared between callers,
+    so they must be treated as read-only; derive changed copies with
+    ``dataclasses.replace``.
 
     Args:
         func: The function to extract information from.
@@ -103,36 +205,57 @@ def extract_function_info(func: Callable[..., Any]) -> FunctionInfo:
     Raises:
         IntrospectionError: If the function cannot be introspected.
     """
+    sources = _info_sources(func)
+    cacheable = True
+    try:
+        cached = _FUNCTION_INFO_CACHE.get(func)
+    except TypeError:
+        # Unhashable or not weak-referenceable; introspect without caching
+        cached = None
+        cacheable = False
+    if cached is not None:
+        cached_sources, cached_info = cached
+        if all(a is b for a, b in zip(cached_sources, sources)):
+            return cached_info
+
     # Get basic function metadata
     name = getattr(func, "__name__", "<anonymous>")
     qualname = getattr(func, "__qualname__", name)
     module = getattr(func, "__module__", None)
 
-    # Extract parameters
-    parameters = extract_parameters(func)
+    # Extract parameters and return type from one set of type hints
+    hints, resolved = _get_hints(func)
+    parameters = _build_parameters(func, hints, include_self=False)
+    return_type = hints.get("return")
 
-    # Get return type
-    try:
-        hints = get_type_hints(func, include_extras=True)
-        return_type = hints.get("return")
-    except Exception:
-        return_type = getattr(func, "__annotations__", {}).get("return")
-
-    # Get source location
+    # Get source location from the code object, which needs no file access;
+    # pseudo-files such as "<string>" have no source to point at. Decorated
+    # functions report where the original function is defined.
     source_file = None
     line_number = None
     try:
-        source_file = inspect.getsourcefile(func)
-        # Get the line number of the function definition
-        _, line_number = inspect.getsourcelines(func)
-    except (OSError, TypeError):
-        # Source not available (e.g., built-in functions)
-        pass
+        target = inspect.unwrap(func)
+    except ValueError:
+        # __wrapped__ chain forms a cycle
+        target = func
+    code = getattr(target, "__code__", None)
+    if code is not None:
+        if not code.co_filename.startswith("<"):
+            source_file = code.co_filename
+            line_number = code.co_firstlineno
+    else:
+        try:
+            source_file = inspect.getsourcefile(target)
+            # Get the line number of the function definition
+            _, line_number = inspect.getsourcelines(target)
+        except (OSError, TypeError):
+            # Source not available (e.g., built-in functions)
+            pass
 
     # Get docstring (description will be parsed separately)
     doc = inspect.getdoc(func)
 
-    return FunctionInfo(
+    info = FunctionInfo(
         name=name,
         qualname=qualname,
         description=doc,
@@ -143,6 +266,11 @@ def extract_function_info(func: Callable[..., Any]) -> FunctionInfo:
         line_number=line_number,
     )
 
+    if resolved and cacheable:
+        _FUNCTION_INFO_CACHE[func] = (sources, info)
+
+    return info
+
 
 __all__ = [
     "extract_function_info",
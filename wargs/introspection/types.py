@@ -6,95 +6,109 @@ argument parsing.
 
 from __future__ import annotations
 
+import sys
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any, Callable, Literal, Union, get_args, get_origin
 
-from wArgs.core.config import TypeInfo
+from wArgs.core.config import TypeInfo, make_type_info
 
 if TYPE_CHECKING:
     from wArgs.converters.registry import ConverterRegistry
 
 # Types that are natively supported by argparse
-BASIC_TYPES: dict[type, Callable[[str], Any]] = {
-    str: str,
-    int: int,
-    float: float,
-    bool: bool,  # Special handling needed
-    Path: Path,
-}
+BASIC_TYPES: MappingProxyType[type, Callable[[str], Any]] = MappingProxyType(
+    {
+        str: str,
+        int: int,
+        float: float,
+        bool: bool,  # Special handling needed
+        Path: Path,
+    }
+)
+
+_NONE_TYPE = type(None)
+
+# Origins that mark a union; `str | None` has origin types.UnionType on 3.10+
+if sys.version_info >= (3, 10):
+    from types import UnionType
+
+    _UNION_ORIGINS: tuple[Any, ...] = (Union, UnionType)
+else:
+    _UNION_ORIGINS = (Union,)  # pragma: no cover
 
 # Collection types that need nargs handling
-COLLECTION_TYPES: set[type] = {list, tuple, set, frozenset}
+COLLECTION_TYPES: frozenset[type] = frozenset({list, tuple, set, frozenset})
+
+# Lookups keyed by id(), so checking an annotation is a pointer compare
+# instead of hashing it (which a metaclass may make expensive, and which
+# fails outright for unhashable annotations). They are built once from the
+# read-only tables above.
+_BASIC_CONVERTERS: dict[int, Callable[[str], Any]] = {
+    id(basic_type): converter for basic_type, converter in BASIC_TYPES.items()
+}
+_COLLECTION_TYPE_IDS: frozenset[int] = frozenset(map(id, COLLECTION_TYPES))
+
+# Pre-resolved TypeInfo for the basic types, returned without introspection
+_BASIC_TYPE_INFO: dict[int, TypeInfo] = {
+    id(basic_type): make_type_info(origin=basic_type, converter=converter)
+    for basic_type, converter in BASIC_TYPES.items()
+}
 
 
-def _is_optional_type(annotation: Any) -> tuple[bool, Any]:
+def _is_optional_type(
+    annotation: Any, origin: Any, args: tuple[Any, ...]
+) -> tuple[bool, Any]:
     """Check if a type is Optional[T] and extract T.
 
     Optional[T] is equivalent to Union[T, None].
 
     Args:
         annotation: The type annotation to check.
+        origin: get_origin(annotation).
+        args: get_args(annotation).
 
     Returns:
         Tuple of (is_optional, inner_type). inner_type is None if
         the annotation is just Optional without an inner type.
     """
-    origin = get_origin(annotation)
-
-    # Handle Union types (including Optional)
-    # In Python 3.10+, `str | None` creates types.UnionType
-    # get_origin returns types.UnionType for that
-    if origin is Union:
-        args = get_args(annotation)
-        # Optional[T] is Union[T, None]
-        non_none_args = [arg for arg in args if arg is not type(None)]
-        if len(non_none_args) == 1 and type(None) in args:
+    # Optional[T] is Union[T, None]
+    if origin in _UNION_ORIGINS and _NONE_TYPE in args:
+        non_none_args = tuple(arg for arg in args if arg is not _NONE_TYPE)
+        if len(non_none_args) == 1:
             return True, non_none_args[0]
-        elif type(None) in args:
-            # Union with None and multiple other types
-            return True, Union[tuple(non_none_args)]
-
-    # Python 3.10+ union syntax: str | None creates types.UnionType
-    import types
-
-    union_type = getattr(types, "UnionType", None)
-    if union_type is not None and isinstance(annotation, union_type):
-        args = get_args(annotation)
-        non_none_args = [arg for arg in args if arg is not type(None)]
-        if len(non_none_args) == 1 and type(None) in args:
-            return True, non_none_args[0]
-        elif type(None) in args:
-            return True, Union[tuple(non_none_args)]
+        # Union with None and multiple other types
+        return True, Union[non_none_args]
 
     return False, annotation
 
 
-def _is_literal_type(annotation: Any) -> tuple[bool, tuple[Any, ...]]:
+def _is_literal_type(
+    origin: Any, args: tuple[Any, ...]
+) -> tuple[bool, tuple[Any, ...]]:
     """Check if a type is Literal and extract values.
 
     Args:
-        annotation: The type annotation to check.
+        origin: get_origin() of the type annotation to check.
+        args: get_args() of the type annotation.
 
     Returns:
         Tuple of (is_literal, literal_values).
     """
-    origin = get_origin(annotation)
-
-    # Check for Literal
+    # The module-level import is typing.Literal itself on every supported
+    # Python, so one identity check covers it
     if origin is Literal:
-        return True, get_args(annotation)
+        return True, args
 
-    # Python 3.8+ has typing.Literal
-    try:
-        from typing import Literal as TypingLiteral
+    return False, ()
 
-        if origin is TypingLiteral:
-            return True, get_args(annotation)
-    except ImportError:
-        pass
 
-    return False, ()
+@lru_cache(maxsize=512)
+def _enum_class(cls: type) -> type[Enum] | None:
+    """Return cls if it is an Enum subclass, else None; cached per class."""
+    return cls if issubclass(cls, Enum) else None
 
 
 def _is_enum_type(annotation: Any) -> tuple[bool, type[Enum] | None]:
@@ -106,12 +120,14 @@ def _is_enum_type(annotation: Any) -> tuple[bool, type[Enum] | None]:
     Returns:
         Tuple of (is_enum, enum_class).
     """
-    try:
-        if isinstance(annotation, type) and issubclass(annotation, Enum):
-            return True, annotation
-    except TypeError:  # pragma: no cover
-        # Can happen with some generic types
-        pass
+    if isinstance(annotation, type):
+        try:
+            enum_class = _enum_class(annotation)
+        except TypeError:  # pragma: no cover
+            # Can happen with some generic types (or unhashable metaclasses)
+            return False, None
+        if enum_class is not None:
+            return True, enum_class
 
     return False, None
 
@@ -125,23 +141,33 @@ def _make_enum_converter(enum_class: type[Enum]) -> Callable[[str], Enum]:
     Returns:
         A function that converts string names to enum members.
     """
+    # Look names up in the member map directly, skipping the metaclass
+    # __getitem__; unknown names still raise KeyError. The function keeps
+    # the name "convert", which argparse and explain() display.
+    member_map = getattr(enum_class, "_member_map_", None)
+    if isinstance(member_map, dict):
 
-    def convert(s: str) -> Enum:
+        def convert(s: str) -> Enum:
+            return member_map[s]  # type: ignore[no-any-return]
+
+        return convert
+
+    def convert_by_name(s: str) -> Enum:  # pragma: no cover (non-stdlib enums)
         return enum_class[s]
 
-    return convert
+    convert_by_name.__name__ = "convert"
+    return convert_by_name
 
 
-def _get_collection_element_type(annotation: Any) -> Any:
+def _get_collection_element_type(args: tuple[Any, ...]) -> Any:
     """Get the element type of a collection annotation.
 
     Args:
-        annotation: A collection type annotation (e.g., list[str]).
+        args: get_args() of a collection type annotation (e.g., list[str]).
 
     Returns:
         The element type, or None if not determinable.
     """
-    args = get_args(annotation)
     if args:
         return args[0]
     return None  # pragma: no cover (only called when args exist)
@@ -163,16 +189,18 @@ def _get_converter(
     if annotation is None or annotation is type(None):
         return None
 
-    # Check registry first for custom converters
+    # Basic types always use the built-in converters, as in resolve_type,
+    # so they skip the registry lookup
+    basic_converter = _BASIC_CONVERTERS.get(id(annotation))
+    if basic_converter is not None:
+        return basic_converter
+
+    # Check registry for custom converters
     if registry is not None and isinstance(annotation, type):
         custom_converter = registry.get(annotation)
         if custom_converter is not None:
             return custom_converter
 
-    # Check basic types
-    if annotation in BASIC_TYPES:
-        return BASIC_TYPES[annotation]
-
     # Check if it's a class with a string constructor
     if isinstance(annotation, type):
         # Most types that can be constructed from a string will work
@@ -196,6 +224,10 @@ def resolve_type(
     - Nested types
     - Custom types with registered converters
 
+    Results without a registry are cached per annotation, least recently
+    used first out, and shared between callers, which must treat them as
+    read-only.
+
     Args:
         annotation: The type annotation to resolve.
         registry: Optional converter registry for custom type converters.
@@ -204,28 +236,59 @@ def resolve_type(
         TypeInfo with resolved type information.
     """
     if annotation is None:
-        return TypeInfo()
+        return make_type_info()
+
+    # Fast path for the basic types that dominate CLI signatures
+    basic_info = _BASIC_TYPE_INFO.get(id(annotation))
+    if basic_info is not None:
+        return basic_info
+
+    # A registry can change between calls, so only registry-free
+    # resolution is cached
+    if registry is not None:
+        return _resolve_type(annotation, registry)
+
+    args_key = _args_key(annotation)
+    try:
+        hash((annotation, args_key))
+    except TypeError:
+        # Unhashable annotation metadata; resolve without caching
+        return _resolve_type(annotation, None)
+    return _resolve_cached(annotation, args_key)
+
+
+def _args_key(annotation: Any) -> tuple[Any, ...]:
+    """Key an annotation's args, recursively, by type, value and order.
+
+    Equal annotations can resolve differently (Union[int, str] ==
+    Union[str, int], but args keep their order), so the cache key
+    includes this alongside the annotation.
+    """
+    return tuple((type(arg), arg, _args_key(arg)) for arg in get_args(annotation))
+
+
+@lru_cache(maxsize=1024)
+def _resolve_cached(annotation: Any, args_key: tuple[Any, ...]) -> TypeInfo:
+    """Resolve an annotation without a registry; cached per annotation."""
+    return _resolve_type(annotation, None)
+
+
+def _resolve_type(annotation: Any, registry: ConverterRegistry | None) -> TypeInfo:
+    """Resolve a non-basic annotation; see resolve_type."""
+    # Get origin and args once; the checks below all share them
+    origin = get_origin(annotation)
+    args = get_args(annotation)
 
     # Check for Optional first
-    is_optional, inner_type = _is_optional_type(annotation)
+    is_optional, inner_type = _is_optional_type(annotation, origin, args)
     if is_optional and inner_type is not annotation:
         # Recursively resolve the inner type
-        inner_info = resolve_type(inner_type, registry)
-        return TypeInfo(
-            origin=inner_info.origin,
-            args=inner_info.args,
-            is_optional=True,
-            is_literal=inner_info.is_literal,
-            literal_values=inner_info.literal_values,
-            is_enum=inner_info.is_enum,
-            enum_class=inner_info.enum_class,
-            converter=inner_info.converter,
-        )
+        return resolve_type(inner_type, registry)._replace(is_optional=True)
 
     # Check for Literal
-    is_literal, literal_values = _is_literal_type(annotation)
+    is_literal, literal_values = _is_literal_type(origin, args)
     if is_literal:
-        return TypeInfo(
+        return make_type_info(
             origin=type(literal_values[0]) if literal_values else str,
             is_literal=True,
             literal_values=literal_values,
@@ -235,40 +298,29 @@ def resolve_type(
     # Check for Enum
     is_enum, enum_class = _is_enum_type(annotation)
     if is_enum and enum_class is not None:
-        return TypeInfo(
+        return make_type_info(
             origin=enum_class,
             is_enum=True,
             enum_class=enum_class,
             converter=_make_enum_converter(enum_class),
         )
 
-    # Get origin for generic types
-    origin = get_origin(annotation)
-    args = get_args(annotation)
-
     # Handle collection types
-    if origin in COLLECTION_TYPES or annotation in COLLECTION_TYPES:
+    if id(origin) in _COLLECTION_TYPE_IDS or id(annotation) in _COLLECTION_TYPE_IDS:
         actual_origin = origin if origin else annotation
-        element_type = _get_collection_element_type(annotation) if args else str
+        element_type = _get_collection_element_type(args) if args else str
         element_converter = _get_converter(element_type, registry)
 
-        return TypeInfo(
+        return make_type_info(
             origin=actual_origin,
             args=args,
             converter=element_converter,
         )
 
-    # Handle basic types
-    if annotation in BASIC_TYPES:
-        return TypeInfo(
-            origin=annotation,
-            converter=BASIC_TYPES[annotation],
-        )
-
-    # Handle other types - check registry first, then class constructor
+    # Handle other types - check registry, then class constructor
     converter = _get_converter(annotation, registry)
 
-    return TypeInfo(
+    return make_type_info(
         origin=annotation if isinstance(annotation, type) else origin,
         args=args,
         converter=converter,
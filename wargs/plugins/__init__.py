@@ -7,6 +7,7 @@ from wArgs.plugins.interface import ConverterPlugin
 from wArgs.plugins.registry import (
     PluginError,
     PluginRegistry,
+    clear_entry_point_cache,
     discover_entry_points,
     get_plugin_registry,
 )
@@ -15,6 +16,7 @@ __all__ = [
     "ConverterPlugin",
     "PluginError",
     "PluginRegistry",
+    "clear_entry_point_cache",
     "discover_entry_points",
     "get_plugin_registry",
 ]
@@ -17,6 +17,37 @@ else:
 if TYPE_CHECKING:
     from wArgs.converters.registry import ConverterRegistry
 
+# Entry points per group. Scanning installed distributions is slow, so each
+# group is looked up once per process, for every registry, until
+# clear_entry_point_cache().
+_ENTRY_POINTS_CACHE: dict[str, tuple[Any, ...]] = {}
+
+
+def _group_entry_points(group: str) -> tuple[Any, ...]:
+    """Get the entry points for a group, looking them up once.
+
+    Args:
+        group: The entry point group name.
+
+    Returns:
+        The group's entry points.
+    """
+    eps = _ENTRY_POINTS_CACHE.get(group)
+    if eps is None:
+        eps = _ENTRY_POINTS_CACHE[group] = tuple(entry_points(group=group))
+    return eps
+
+
+def clear_entry_point_cache() -> None:
+    """Forget the entry points found so far.
+
+    Entry points are looked up once per group and shared by every
+    PluginRegistry and by discover_entry_points(). Call this after
+    installing or removing plugins at runtime so the next lookup sees
+    the change.
+    """
+    _ENTRY_POINTS_CACHE.clear()
+
 
 class PluginError(Exception):
     """Error loading or executing a plugin."""
@@ -38,7 +69,10 @@ class PluginRegistry:
     def __init__(self) -> None:
         """Initialize the plugin registry."""
         self._loaded_plugins: dict[str, list[str]] = {}
-        self._failed_plugins: dict[str, list[tuple[str, str]]] = {}
+        # Failures keep (name, exception) with the traceback dropped, so the
+        # failed import's frames are not kept alive; messages are formatted
+        # on request
+        self._failed_plugins: dict[str, list[tuple[str, Exception]]] = {}
 
     def load_converters(
         self,
@@ -64,25 +98,29 @@ class PluginRegistry:
             # Already loaded
             return len(self._loaded_plugins[group])
 
-        self._loaded_plugins[group] = []
-        self._failed_plugins[group] = []
+        # Group and plugin names are kept for the life of the registry and
+        # looked up by callers, so store interned copies
+        group = sys.intern(group)
+        loaded = self._loaded_plugins[group] = []
+        failed = self._failed_plugins[group] = []
 
-        eps = entry_points(group=group)
+        eps = _group_entry_points(group)
         count = 0
 
         for ep in eps:
+            name = sys.intern(ep.name)
             try:
                 register_func = ep.load()
                 register_func(converter_registry)
-                self._loaded_plugins[group].append(ep.name)
+                loaded.append(name)
                 count += 1
             except Exception as e:
-                error_msg = f"{type(e).__name__}: {e}"
-                self._failed_plugins[group].append((ep.name, error_msg))
                 if raise_on_error:
+                    failed.append((name, e))
                     raise PluginError(
                         f"Failed to load plugin '{ep.name}' from group '{group}': {e}"
                     ) from e
+                failed.append((name, e.with_traceback(None)))
 
         return count
 
@@ -106,7 +144,10 @@ class PluginRegistry:
         Returns:
             List of (plugin_name, error_message) tuples.
         """
-        return self._failed_plugins.get(group, [])
+        return [
+            (name, f"{type(error).__name__}: {error}")
+            for name, error in self._failed_plugins.get(group, [])
+        ]
 
     def is_loaded(self, group: str) -> bool:
         """Check if plugins for a group have been loaded.
@@ -122,7 +163,9 @@ class PluginRegistry:
     def clear(self) -> None:
         """Clear all loaded plugin state.
 
-        This allows plugins to be reloaded on the next call.
+        This allows plugins to be reloaded on the next call. Entry points
+        are not rediscovered; call clear_entry_point_cache() first to find
+        plugins installed since the last lookup.
         """
         self._loaded_plugins.clear()
         self._failed_plugins.clear()
@@ -131,6 +174,8 @@ class PluginRegistry:
 def discover_entry_points(group: str) -> list[dict[str, Any]]:
     """Discover available entry points for a group.
 
+    Lookups are cached per group; see clear_entry_point_cache().
+
     Args:
         group: The entry point group name.
 
@@ -140,7 +185,7 @@ def discover_entry_points(group: str) -> list[dict[str, Any]]:
         - value: The entry point value (module:attr)
         - group: The entry point group
     """
-    eps = entry_points(group=group)
+    eps = _group_entry_points(group)
     return [
         {
             "name": ep.name,
@@ -170,6 +215,7 @@ def get_plugin_registry() -> PluginRegistry:
 __all__ = [
     "PluginError",
     "PluginRegistry",
+    "clear_entry_point_cache",
     "discover_entry_points",
     "get_plugin_registry",
 ]
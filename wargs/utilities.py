@@ -25,27 +25,39 @@ from __future__ import annotations
 
 import os
 import sys
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any, Callable
 
 if TYPE_CHECKING:
     from argparse import ArgumentParser
 
-    from wArgs.core.config import ParserConfig
+    from wArgs.core.config import ArgumentConfig, ParserConfig
     from wArgs.decorator import WargsClassWrapper, WargsWrapper
 
 
 # Environment variable for debug output
 WARGS_DEBUG_VAR = "WARGS_DEBUG"
 
+# Lowercased WARGS_DEBUG values that enable debug output
+_TRUTHY_VALUES = frozenset(("1", "true", "yes", "on"))
 
+
+@lru_cache(maxsize=1)
 def is_debug_enabled() -> bool:
     """Check if WARGS_DEBUG environment variable is set.
 
+    The variable is read once per process; later changes to it are not
+    seen unless _reset_debug_cache() is called.
+
     Returns:
         True if WARGS_DEBUG is set to a truthy value (1, true, yes, on).
     """
-    value = os.environ.get(WARGS_DEBUG_VAR, "").lower()
-    return value in ("1", "true", "yes", "on")
+    return os.environ.get(WARGS_DEBUG_VAR, "").lower() in _TRUTHY_VALUES
+
+
+def _reset_debug_cache() -> None:
+    """Forget the cached WARGS_DEBUG setting so it is read again."""
+    is_debug_enabled.cache_clear()
 
 
 def debug_print(*args: Any, **kwargs: Any) -> None:
@@ -73,10 +85,9 @@ def _get_wrapper(
     Raises:
         TypeError: If func is not a wargs-decorated function.
     """
-    from wArgs.decorator import WargsClassWrapper, WargsWrapper
-
-    if isinstance(func, (WargsWrapper, WargsClassWrapper)):
-        return func
+    # Both wrapper classes set this marker, so no decorator import is needed
+    if getattr(func, "__wargs_wrapper__", False) is True:
+        return func  # type: ignore[return-value]
 
     raise TypeError(
         f"Expected a @wargs decorated function or class, got {type(func).__name__}. "
@@ -141,13 +152,47 @@ def get_config(
     """
     wrapper = _get_wrapper(func)
 
-    # Ensure parser is built (which also builds config)
-    _ = wrapper.parser
+    # Build the config if needed; the parser itself is not required
+    if wrapper._parser_config is None:
+        wrapper._build_config()
 
-    # Access the internal config
     return wrapper._parser_config  # type: ignore[return-value]
 
 
+def _format_argument(arg: ArgumentConfig) -> str:
+    """Format one argument as a line of explain() output.
+
+    Args:
+        arg: The argument to describe.
+
+    Returns:
+        The formatted line, without the verbose help line.
+    """
+    # Build flag string
+    if arg.positional:
+        flag_str = arg.name
+    else:
+        flag_str = ", ".join(arg.flags) if arg.flags else f"--{arg.name}"
+
+    # Build type string
+    type_str = ""
+    if arg.type:
+        type_name = getattr(arg.type, "__name__", str(arg.type))
+        type_str = f" ({type_name})"
+
+    # Build required/default string
+    req_str = ""
+    if arg.required:
+        req_str = " [required]"
+    elif arg.default is not None:
+        req_str = f" [default: {arg.default!r}]"
+
+    # Build choices string
+    choice_str = f" choices: {arg.choices}" if arg.choices else ""
+
+    return f"  {flag_str}{type_str}{req_str}{choice_str}"
+
+
 def explain(
     func: Callable[..., Any] | WargsWrapper | WargsClassWrapper,
     *,
@@ -210,33 +255,7 @@ def explain(
         for arg in config.arguments:
             if arg.skip:
                 continue
-
-            # Build flag string
-            if arg.positional:
-                flag_str = arg.name
-            else:
-                flag_str = ", ".join(arg.flags) if arg.flags else f"--{arg.name}"
-
-            # Build type string
-            type_str = ""
-            if arg.type:
-                type_name = getattr(arg.type, "__name__", str(arg.type))
-                type_str = f" ({type_name})"
-
-            # Build required/default string
-            req_str = ""
-            if arg.required:
-                req_str = " [required]"
-            elif arg.default is not None:
-                req_str = f" [default: {arg.default!r}]"
-
-            # Build choices string
-            choice_str = ""
-            if arg.choices:
-                choice_str = f" choices: {arg.choices}"
-
-            lines.append(f"  {flag_str}{type_str}{req_str}{choice_str}")
-
+            lines.append(_format_argument(arg))
             if verbose and arg.help:
                 lines.append(f"    Help: {arg.help}")
 
@@ -251,11 +270,11 @@ def explain(
             lines.append(f"  {name}: {desc}")
 
             if verbose and subconfig.arguments:
-                for arg in subconfig.arguments:
-                    if arg.skip:
-                        continue
-                    flag_str = ", ".join(arg.flags) if arg.flags else arg.name
-                    lines.append(f"    {flag_str}")
+                lines.extend(
+                    f"    {', '.join(arg.flags) if arg.flags else arg.name}"
+                    for arg in subconfig.arguments
+                    if not arg.skip
+                )
 
     return "\n".join(lines)
 